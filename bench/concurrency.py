@@ -0,0 +1,154 @@
+#!/usr/bin/python
+"""
+Concurrency benchmark comparing running portal deployments, for example
+mod_wsgi daemon process groups with different process and thread counts.
+
+Opens a number of concurrent client sessions against each target and reports
+throughput, latency percentiles and errors per concurrency level. Each client
+logs in once and then requests the given path repeatedly, holding a session
+open for the whole run.
+
+    python bench/concurrency.py \\
+        --target threads15=http://127.0.0.1:80 \\
+        --target threads32=http://127.0.0.1:8080 \\
+        --username bench --password bench --concurrency 10,50,200
+"""
+import re
+import sys
+import threading
+from time import time
+from argparse import ArgumentParser
+
+# Python 2/3 HTTP client
+try:
+    from urllib.parse import urlsplit, urlencode
+    from http.client import HTTPConnection
+except ImportError:
+    from urlparse import urlsplit
+    from urllib import urlencode
+    from httplib import HTTPConnection
+
+# CSRF token in the login form
+CSRF = re.compile(r'name=[\'"]csrfmiddlewaretoken[\'"] value=[\'"]([^\'"]+)[\'"]')
+
+def percentile(samples, p):
+    """
+    Return the p-th percentile of a sorted list of samples.
+    """
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, int(round(p / 100.0 * (len(samples) - 1))))]
+
+class Client(threading.Thread):
+    """
+    A single client session issuing sequential requests.
+    """
+    def __init__(self, url, path, requests, credentials=None, timeout=30):
+        super(Client, self).__init__()
+        self.daemon      = True
+        self.url         = urlsplit(url)
+        self.path        = path
+        self.requests    = requests
+        self.credentials = credentials
+        self.timeout     = timeout
+        self.cookies     = {}
+        self.samples     = []
+        self.errors      = 0
+
+    def _request(self, method, path, body=None):
+        """
+        Send a request on a fresh connection, tracking cookies.
+        """
+        conn    = HTTPConnection(self.url.hostname, self.url.port or 80, timeout=self.timeout)
+        headers = {'Cookie': '; '.join(['{0}={1}'.format(k, v) for k, v in self.cookies.items()])}
+        if body is not None:
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+        try:
+            conn.request(method, path, body, headers)
+            response = conn.getresponse()
+            data     = response.read()
+            for header, value in response.getheaders():
+                if header.lower() == 'set-cookie':
+                    name, _, rest = value.partition('=')
+                    self.cookies[name.strip()] = rest.split(';')[0]
+            return response.status, data
+        finally:
+            conn.close()
+
+    def login(self):
+        """
+        Log in through the portal auth handler.
+        """
+        status, page = self._request('GET', '/auth')
+        token = CSRF.search(page.decode('utf-8', 'replace'))
+        form  = dict(self.credentials, action='login')
+        if token:
+            form['csrfmiddlewaretoken'] = token.group(1)
+        self._request('POST', '/auth', urlencode(form))
+
+    def run(self):
+        try:
+            if self.credentials:
+                self.login()
+        except Exception:
+            self.errors += self.requests
+            return
+        for i in range(self.requests):
+            started = time()
+            try:
+                status, _ = self._request('GET', self.path)
+                if status >= 500:
+                    self.errors += 1
+                    continue
+            except Exception:
+                self.errors += 1
+                continue
+            self.samples.append(time() - started)
+
+def run(url, path, concurrency, requests, credentials):
+    """
+    Run a concurrency level against a target.
+    """
+    clients = [Client(url, path, requests, credentials) for i in range(concurrency)]
+    started = time()
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+    elapsed = time() - started
+
+    samples = sorted([s for c in clients for s in c.samples])
+    return {
+        'rps': len(samples) / elapsed,
+        'p50': percentile(samples, 50) * 1000,
+        'p90': percentile(samples, 90) * 1000,
+        'p99': percentile(samples, 99) * 1000,
+        'errors': sum([c.errors for c in clients])
+    }
+
+def main():
+    parser = ArgumentParser(description='Compare portal deployment concurrency')
+    parser.add_argument('--target', action='append', required=True, help='name=url of a running portal, may be repeated')
+    parser.add_argument('--path', default='/home', help='Path requested by each client')
+    parser.add_argument('--concurrency', default='10,50,100', help='Comma separated concurrent client counts')
+    parser.add_argument('--requests', type=int, default=20, help='Requests per client')
+    parser.add_argument('--username', help='Portal user to log in as')
+    parser.add_argument('--password', help='Portal user password')
+    args = parser.parse_args()
+
+    credentials = None if not args.username else {'username': args.username, 'password': args.password or ''}
+    row = '{0:<10} {1:>11} {2:>9} {3:>9} {4:>9} {5:>9} {6:>7}'
+    print(row.format('target', 'concurrency', 'rps', 'p50 ms', 'p90 ms', 'p99 ms', 'errors'))
+
+    failed = False
+    for target in args.target:
+        name, _, url = target.partition('=')
+        for concurrency in [int(c) for c in args.concurrency.split(',')]:
+            r = run(url, args.path, concurrency, args.requests, credentials)
+            failed = failed or bool(r['errors'])
+            print(row.format(name, concurrency, '{0:.1f}'.format(r['rps']), '{0:.2f}'.format(r['p50']),
+                '{0:.2f}'.format(r['p90']), '{0:.2f}'.format(r['p99']), r['errors']))
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
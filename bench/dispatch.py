@@ -0,0 +1,245 @@
+#!/usr/bin/python
+"""
+Offline benchmark for the portal dispatch pipeline.
+
+Drives lense.portal.ui.core.request.dispatch through the Django test client
+with a stubbed LENSE global, a fake user/groups store, an in-memory view of
+the share directory and a SQLite session database. Requires Django and
+lense-common to be importable.
+
+    python bench/dispatch.py --requests 500
+    python bench/dispatch.py --save-baseline bench/baseline.json
+    python bench/dispatch.py --baseline bench/baseline.json --tolerance 0.15
+"""
+import os
+import gc
+import sys
+import json
+import shutil
+import tempfile
+import __builtin__
+from time import time
+from argparse import ArgumentParser
+
+# Optional allocation tracking (backported on Python 2)
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+# Repository paths
+BENCH = os.path.dirname(os.path.abspath(__file__))
+ROOT  = os.path.dirname(BENCH)
+LIB   = '{0}/usr/lib/python2.7/dist-packages'.format(ROOT)
+SHARE = '{0}/usr/share/lense/portal'.format(ROOT)
+
+# Benchmark scenarios: (name, path, authenticated)
+SCENARIOS = [
+    ('auth', '/auth', False),
+    ('home', '/home', True),
+    ('home-redirect', '/home', False),
+    ('admin-users', '/admin?view=users', True),
+    ('admin-redirect', '/admin?view=users', False),
+    ('tools-manifests', '/tools?view=manifests', True)
+]
+
+# Benchmark user
+USERNAME = 'bench'
+PASSWORD = 'bench'
+
+def percentile(samples, p):
+    """
+    Return the p-th percentile of a sorted list of samples.
+    """
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, int(round(p / 100.0 * (len(samples) - 1))))]
+
+class Allocations(object):
+    """
+    Measure allocations with tracemalloc, falling back to the change in the
+    number of objects tracked by the garbage collector.
+    """
+    def __enter__(self):
+        gc.collect()
+        if tracemalloc:
+            tracemalloc.start()
+            self.before = tracemalloc.get_traced_memory()[0]
+        else:
+            self.before = len(gc.get_objects())
+        return self
+
+    def __exit__(self, *args):
+        if tracemalloc:
+            self.value = tracemalloc.get_traced_memory()[0] - self.before
+            tracemalloc.stop()
+        else:
+            gc.collect()
+            self.value = len(gc.get_objects()) - self.before
+
+    @property
+    def unit(self):
+        return 'bytes' if tracemalloc else 'objects'
+
+class DispatchBenchmark(object):
+    """
+    Set up the stubbed portal environment and run each scenario.
+    """
+    def __init__(self, requests, share=SHARE, production=False):
+        self.requests   = requests
+        self.share      = share
+        self.production = production
+        self.tmpdir     = tempfile.mkdtemp(prefix='lense-bench-')
+
+    def setup(self):
+        """
+        Bootstrap Django and the stubbed LENSE global.
+        """
+        os.environ['LENSE_BENCH_SHARE']      = self.share
+        os.environ['LENSE_BENCH_DB']         = '{0}/sessions.db'.format(self.tmpdir)
+        os.environ['LENSE_BENCH_PRODUCTION'] = '1' if self.production else '0'
+        os.environ['DJANGO_SETTINGS_MODULE'] = 'settings'
+        sys.path.insert(0, BENCH)
+
+        # Load the portal from this tree alongside the installed lense-common
+        import lense
+        lense.__path__.insert(0, '{0}/lense'.format(LIB))
+
+        # Point the shared paths at the benchmark share tree
+        from lense.common.vars import SHARE as SHARED
+        setattr(SHARED, 'PORTAL', self.share)
+
+        # Stubbed LENSE global
+        from lense_stub import FakeLense, FakeUser
+        __builtin__.LENSE = FakeLense(self.share, [FakeUser(USERNAME, admin=True)], production=self.production)
+
+        # Bootstrap Django / session database
+        import django
+        from django.core.management import call_command
+        django.setup()
+        call_command('migrate', interactive=False, verbosity=0)
+
+        from django.contrib.auth.models import User
+        User.objects.create_user(USERNAME, password=PASSWORD)
+
+    def client(self, authenticated):
+        """
+        Return a test client, logged in if required.
+        """
+        from django.test import Client
+        client = Client()
+        if authenticated:
+            client.login(username=USERNAME, password=PASSWORD)
+        return client
+
+    def run_scenario(self, name, path, authenticated):
+        """
+        Run a single scenario and return its measurements.
+        """
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        client = self.client(authenticated)
+
+        # Warm up caches before measuring
+        response = client.get(path)
+
+        samples = []
+        lookups = LENSE.OBJECTS.USER.lookups
+        with Allocations() as allocations:
+            with CaptureQueriesContext(connection) as queries:
+                started = time()
+                for i in range(self.requests):
+                    t = time()
+                    response = client.get(path)
+                    samples.append(time() - t)
+                elapsed = time() - started
+        samples.sort()
+
+        return {
+            'status': response.status_code,
+            'redirect': response.status_code in (301, 302),
+            'rps': self.requests / elapsed,
+            'p50': percentile(samples, 50) * 1000,
+            'p90': percentile(samples, 90) * 1000,
+            'p99': percentile(samples, 99) * 1000,
+            'queries': len(queries) / float(self.requests),
+            'lookups': (LENSE.OBJECTS.USER.lookups - lookups) / float(self.requests),
+            'allocations': allocations.value / float(self.requests),
+            'allocations_unit': allocations.unit
+        }
+
+    def run(self):
+        """
+        Run all scenarios.
+        """
+        try:
+            self.setup()
+            return dict([(name, self.run_scenario(name, path, auth)) for name, path, auth in SCENARIOS])
+        finally:
+            shutil.rmtree(self.tmpdir)
+
+def report(results):
+    """
+    Print the results, authenticated pages and redirects separately.
+    """
+    row = '{0:<18} {1:>6} {2:>9} {3:>8} {4:>8} {5:>8} {6:>8} {7:>8} {8:>12}'
+    for title, redirect in [('Pages', False), ('Redirects', True)]:
+        print('\n{0}'.format(title))
+        print(row.format('scenario', 'status', 'rps', 'p50 ms', 'p90 ms', 'p99 ms', 'queries', 'lookups', 'allocs/req'))
+        for name, _, _ in SCENARIOS:
+            r = results[name]
+            if r['redirect'] != redirect:
+                continue
+            print(row.format(name, r['status'], '{0:.1f}'.format(r['rps']), '{0:.2f}'.format(r['p50']),
+                '{0:.2f}'.format(r['p90']), '{0:.2f}'.format(r['p99']), '{0:.1f}'.format(r['queries']),
+                '{0:.1f}'.format(r['lookups']), '{0:.0f}'.format(r['allocations'])))
+
+def compare(results, baseline, tolerance):
+    """
+    Return a list of regressions against a stored baseline.
+    """
+    regressions = []
+    for name, result in results.iteritems():
+        base = baseline.get(name)
+        if not base:
+            continue
+
+        # Latency / allocations may grow by the tolerance, query counts may not grow at all
+        for key in ['p50', 'p90', 'p99', 'allocations']:
+            if base[key] and result[key] > base[key] * (1 + tolerance):
+                regressions.append('{0}: {1} {2:.2f} > {3:.2f}'.format(name, key, result[key], base[key]))
+        if result['rps'] < base['rps'] * (1 - tolerance):
+            regressions.append('{0}: rps {1:.1f} < {2:.1f}'.format(name, result['rps'], base['rps']))
+        if result['queries'] > base['queries']:
+            regressions.append('{0}: queries {1:.1f} > {2:.1f}'.format(name, result['queries'], base['queries']))
+    return regressions
+
+def main():
+    parser = ArgumentParser(description='Benchmark the portal dispatch pipeline')
+    parser.add_argument('--requests', type=int, default=200, help='Requests per scenario')
+    parser.add_argument('--share', default=SHARE, help='Portal share directory')
+    parser.add_argument('--production', action='store_true', help='Run with production caching enabled')
+    parser.add_argument('--baseline', help='Compare against a stored baseline')
+    parser.add_argument('--save-baseline', help='Store the results as a baseline')
+    parser.add_argument('--tolerance', type=float, default=0.10, help='Allowed relative regression')
+    args = parser.parse_args()
+
+    results = DispatchBenchmark(args.requests, share=args.share, production=args.production).run()
+    report(results)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print('\nRegressions')
+            for regression in regressions:
+                print('  {0}'.format(regression))
+            sys.exit(1)
+        print('\nNo regressions against: {0}'.format(args.baseline))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+"""
+Stubbed LENSE global for offline portal benchmarks: a fake user/groups
+store, an in-memory view of the share directory and just enough of the
+request/HTTP/module helpers to drive the portal dispatch pipeline.
+"""
+import os
+import logging
+import pkgutil
+from importlib import import_module
+
+# Django Libraries
+from django.shortcuts import render
+from django.http import HttpResponseRedirect
+
+class Attrs(object):
+    """
+    Nested attribute access for configuration dictionaries.
+    """
+    def __init__(self, data):
+        for k,v in data.items():
+            setattr(self, k, Attrs(v) if isinstance(v, dict) else v)
+
+class FakeUser(object):
+    """
+    User record returned by the fake user store.
+    """
+    def __init__(self, username, admin=False, groups=None):
+        self.username  = username
+        self.email     = '{0}@example.com'.format(username)
+        self.api_key   = 'key-{0}'.format(username)
+        self.api_token = 'token-{0}'.format(username)
+        self.is_admin  = admin
+        self.groups    = groups or [{'uuid': '00000000-0000-0000-0000-000000000000', 'name': 'administrators'}]
+
+class FakeUserStore(object):
+    """
+    In-memory user/groups store counting lookups.
+    """
+    def __init__(self, users):
+        self.users   = dict([(u.username, u) for u in users])
+        self.lookups = 0
+
+    def get(self, username=None, **kwargs):
+        self.lookups += 1
+        return self.users.get(username)
+
+class MemoryFS(object):
+    """
+    In-memory directory listing of the portal share tree.
+    """
+    def __init__(self, root):
+        self.tree = {}
+        for path, dirs, files in os.walk(root):
+            self.tree[path] = sorted(files)
+
+    def listdir(self, path):
+        return list(self.tree.get(path.rstrip('/'), []))
+
+class FakeSession(object):
+    """
+    LENSE.REQUEST.SESSION wrapper around the Django session.
+    """
+    def __init__(self, session):
+        self.session = session
+
+    def get(self, key, default=None):
+        return self.session.get(key, default)
+
+    def set(self, key, value):
+        self.session[key] = value
+
+class FakeRequestUser(object):
+    """
+    LENSE.REQUEST.USER for the authenticated Django user.
+    """
+    def __init__(self, request, store):
+        user            = store.users.get(request.user.username) if request.user.is_authenticated() else None
+        self.name       = None if not user else user.username
+        self.admin      = bool(user and user.is_admin)
+        self.authorized = bool(user)
+
+class FakeRequest(object):
+    """
+    LENSE.REQUEST constructed from a Django request.
+    """
+    def __init__(self, request, store):
+        self.DJANGO  = request
+        self.path    = request.path.strip('/').split('/')[0] or 'home'
+        self.view    = request.GET.get('view')
+        self.method  = request.method
+        self.current = request.get_full_path()
+        self.script  = request.META.get('SCRIPT_NAME', '')
+        self.client  = request.META.get('REMOTE_ADDR')
+        self.data    = dict(request.GET.items() + request.POST.items())
+        self.USER    = FakeRequestUser(request, store)
+        self.SESSION = FakeSession(request.session)
+
+    def POST(self, key, default=None):
+        return self.DJANGO.POST.get(key, default)
+
+class FakeHTTP(object):
+    """
+    LENSE.HTTP response helpers.
+    """
+    def redirect(self, path, query=None):
+        return HttpResponseRedirect('/{0}{1}'.format(path.lstrip('/'), '' if not query else '?{0}'.format(query)))
+
+    def browser_error(self, template, data):
+        return render(LENSE.REQUEST.DJANGO, template, data, status=int(template.split('/')[-1].split('.')[0]))
+
+class FakeModule(object):
+    """
+    LENSE.MODULE handler discovery.
+    """
+    def handlers(self, ext, load=None):
+        package  = import_module('lense.portal.ui.handlers')
+        handlers = []
+        for _, name, is_pkg in pkgutil.iter_modules(package.__path__):
+            if not is_pkg:
+                continue
+            mod = 'lense.portal.ui.handlers.{0}'.format(name) + ('' if ext == '__init__' else '.{0}'.format(ext))
+            handlers.append({'name': name, 'mod': mod})
+        if not load:
+            return handlers
+        return dict([(h['name'], getattr(import_module(h['mod']), load)) for h in handlers])
+
+class FakeSetup(object):
+    """
+    LENSE.SETUP portal request bootstrap.
+    """
+    def __init__(self, lense):
+        self.lense = lense
+
+    def portal(self, request):
+        from lense.portal import PortalInterface
+        self.lense.REQUEST = FakeRequest(request, self.lense.OBJECTS.USER)
+
+        # Like LENSE.SETUP, the interface is only assigned once constructed
+        self.lense.PORTAL  = None
+        self.lense.PORTAL  = PortalInterface()
+
+class FakeLense(object):
+    """
+    Stubbed LENSE global.
+    """
+    def __init__(self, share, users, production=False):
+        self.CONF    = Attrs({
+            'portal': {
+                'debug': False,
+                'production': production,
+                'log_level': 'INFO',
+                'metrics': {'server_timing': True}
+            },
+            'socket': {'proto': 'http', 'host': 'localhost', 'port': 10551}
+        })
+        self.LOG     = logging.getLogger('lense.bench')
+        self.FS      = MemoryFS(share)
+        self.HTTP    = FakeHTTP()
+        self.MODULE  = FakeModule()
+        self.SETUP   = FakeSetup(self)
+        self.OBJECTS = Attrs({})
+        self.OBJECTS.USER = FakeUserStore(users)
+        self.REQUEST = None
+        self.PORTAL  = None
+
+    def import_class(self, cls, mod, init=True):
+        obj = getattr(import_module(mod), cls)
+        return obj() if init else obj
+
+    def ensure(self, value, isnot=None, error=None, code=500):
+        from lense.common.exceptions import EnsureError
+        if value == isnot:
+            raise EnsureError(error, code=code)
+        return value
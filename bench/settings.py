@@ -0,0 +1,86 @@
+"""
+Django settings for offline portal benchmarks. Mirrors the portal settings
+with a SQLite session database and the share tree given by the benchmark.
+"""
+import os
+
+# Benchmark share tree / database / mode
+SHARE      = os.environ['LENSE_BENCH_SHARE']
+PRODUCTION = os.environ.get('LENSE_BENCH_PRODUCTION') == '1'
+
+DEBUG            = False
+ALLOWED_HOSTS    = ['testserver']
+SECRET_KEY       = 'lense-portal-bench'
+USE_TZ           = True
+STATIC_URL       = '/static/'
+ROOT_URLCONF     = 'lense.portal.ui.core.urls'
+
+# Template loaders
+LOADERS = ['django.template.loaders.filesystem.Loader']
+if PRODUCTION:
+    LOADERS = [('django.template.loaders.cached.Loader', LOADERS)]
+
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'DIRS': [ '{0}/templates'.format(SHARE) ],
+        'APP_DIRS': False,
+        'OPTIONS': {
+            'loaders': LOADERS,
+            'context_processors': [
+                'django.contrib.auth.context_processors.auth',
+                'django.template.context_processors.debug',
+                'django.template.context_processors.static',
+                'django.contrib.messages.context_processors.messages',
+            ],
+        },
+    },
+]
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'
+    },
+    'shared': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'lense-portal-shared'
+    },
+    'portal': {
+        'BACKEND': 'django.core.cache.backends.{0}'.format('locmem.LocMemCache' if PRODUCTION else 'dummy.DummyCache'),
+        'LOCATION': 'lense-portal'
+    },
+    'sessions': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'lense-portal-sessions'
+    }
+}
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ['LENSE_BENCH_DB']
+    }
+}
+
+INSTALLED_APPS = (
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'django.contrib.sessions',
+    'django.contrib.messages',
+    'django.contrib.staticfiles',
+    'lense.portal.ui.util'
+)
+
+MIDDLEWARE_CLASSES = (
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'lense.portal.ui.core.session.SessionTimeout'
+)
+
+SESSION_ENGINE      = 'django.contrib.sessions.backends.db'
+SESSION_SERIALIZER  = 'django.contrib.sessions.serializers.PickleSerializer'
+SESSION_TIMEOUT     = 60
+SESSION_TOUCH_SLACK = 60
+SESSION_CACHE_ALIAS = 'sessions'
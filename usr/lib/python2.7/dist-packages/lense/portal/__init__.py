@@ -2,11 +2,16 @@ __version__ = '0.1'
 
 # Lense Libraries
 from lense.common.exceptions import RequestError
+from lense.portal.ui.core.log import PortalLog
+from lense.portal.ui.core.timing import timed
+from lense.portal.ui.core.user import PortalUser
+from lense.portal.ui.core.routes import PortalRoutes
 
 class PortalBase(object):
-    def log(self, msg, level='info', method=None):
+    def log(self, msg, level='info', method=None, **fields):
         """
-        Wrapper method for logging with a prefix.
+        Wrapper method for logging with a prefix. The message is only
+        constructed if the log level is enabled.
         
         :param    msg: The message to log
         :type     msg: str
@@ -14,32 +19,36 @@ class PortalBase(object):
         :type   level: str
         :param method: Optionally append the method to log prefix
         :type  method: str
+        :param fields: Structured log fields
         """
-        logger = getattr(LENSE.LOG, level, 'info')
-        logger('<TEMPLATE:{0}{1}:{2}@{3}> {4}'.format(
+        PortalLog.write(level, lambda: '<TEMPLATE:{0}{1}:{2}@{3}>'.format(
             self.__class__.__name__, 
             '' if not method else '.{0}'.format(method), 
             LENSE.REQUEST.USER.name,
-            LENSE.REQUEST.client,
-            msg
-        ))
+            LENSE.REQUEST.client
+        ), msg, **fields)
 
 class PortalInterface(PortalBase):
     """
     Interface class for portal commons.
     """
     def __init__(self):
+        with timed('interface'):
         
-        # Load handlers / controllers
-        self.handlers    = LENSE.MODULE.handlers(ext='views', load='HandlerView')
-        self.controllers = LENSE.MODULE.handlers(ext='controller', load='HandlerController')
+            # Process level route table / handlers / controllers
+            self.ROUTES      = PortalRoutes.load()
+            self.handlers    = self.ROUTES.views
+            self.controllers = self.ROUTES.controllers
         
-        # Template / assets handler
-        self.TEMPLATE    = LENSE.import_class('PortalTemplate', 'lense.portal.ui.core.template')
-        self.ASSETS      = LENSE.import_class('PortalAssets', 'lense.portal.ui.core.assets')
+            # Request scoped user context
+            self.USER        = PortalUser()
         
-        # Bootstrap the portal interface
-        self._set_session()
+            # Template / assets handler
+            self.TEMPLATE    = LENSE.import_class('PortalTemplate', 'lense.portal.ui.core.template')
+            self.ASSETS      = LENSE.import_class('PortalAssets', 'lense.portal.ui.core.assets')
+        
+            # Bootstrap the portal interface
+            self._set_session()
         
     def controller(self, **kwargs):
         """
@@ -54,7 +63,7 @@ class PortalInterface(PortalBase):
                 return LENSE.HTTP.redirect('home')
             
             # Return the template response
-            return self.controllers[LENSE.REQUEST.path]().construct(**kwargs)
+            return self.ROUTES[LENSE.REQUEST.path].controller().construct(**kwargs)
             
         # User is not authenticated
         else:
@@ -64,7 +73,7 @@ class PortalInterface(PortalBase):
                 return LENSE.HTTP.redirect('auth')
             
             # Return the template response
-            return self.controllers[LENSE.REQUEST.path]().construct(**kwargs)
+            return self.ROUTES[LENSE.REQUEST.path].controller().construct(**kwargs)
         
     def _set_session(self):
         """
@@ -72,30 +81,20 @@ class PortalInterface(PortalBase):
         """
         if LENSE.REQUEST.USER.authorized:
             
-            # Get the user details
-            user   = LENSE.OBJECTS.USER.get(username=LENSE.REQUEST.USER.name)
-            groups = user.groups
-            
-            # Set the 'is_admin' flag
-            LENSE.REQUEST.SESSION.set('is_admin', LENSE.REQUEST.USER.admin)
+            # Set the 'is_admin' flag, only writing the session if it changed
+            if LENSE.REQUEST.SESSION.get('is_admin') != LENSE.REQUEST.USER.admin:
+                LENSE.REQUEST.SESSION.set('is_admin', LENSE.REQUEST.USER.admin)
             
             # If the active group hasn't been set yet
-            if not LENSE.REQUEST.SESSION.get('active_group'):
-                LENSE.REQUEST.SESSION.set('active_group', groups[0])
+            if not LENSE.REQUEST.SESSION.get('active_group') and self.USER.groups:
+                LENSE.REQUEST.SESSION.set('active_group', self.USER.groups[0])
                 
     def set_active_group(self, group):
         """
         Change the session variable for the active API user group.
         """
-        user = LENSE.OBJECTS.USER.get(username=LENSE.REQUEST.USER.name)
-        
-        # Make sure the user is a member of the group
-        is_member = False
-        for usr_group in user.groups:
-            if usr_group['uuid'] == group:
-                is_member = True
-                break 
         
-        # If the group is valid
-        if is_member:
-            LENSE.REQUEST.SESSION.set('active_group', group)
\ No newline at end of file
+        # If the user is a member of the group
+        if self.USER.is_member(group):
+            LENSE.REQUEST.SESSION.set('active_group', group)
+            PortalUser.invalidate(self.USER.name)
\ No newline at end of file
@@ -1,10 +1,23 @@
+import os
+import json
+from time import time
+from hashlib import sha1
+from threading import Lock
+
+# Lense Libraries
 from lense.common.vars import SHARE
 from lense.common.collection import Collection
+from lense.portal.ui.core.config import option, production
+from lense.portal.ui.core.cache import CacheGenerations
+from lense.portal.ui.core.routes import PortalRoutes
+from lense.portal.ui.core.timing import timed
 
 # Static assets
 STATIC = Collection.create({
     'JS':  '{0}/static/js/lense'.format(SHARE.PORTAL),
-    'CSS': '{0}/static/css'.format(SHARE.PORTAL)
+    'CSS': '{0}/static/css'.format(SHARE.PORTAL),
+    'TEMPLATES': '{0}/templates/handlebars'.format(SHARE.PORTAL),
+    'BUNDLE': '{0}/static/bundle'.format(SHARE.PORTAL)
 })
 
 # Core assets
@@ -37,115 +50,319 @@ CORE   = Collection.create({
     }
 })
 
-class PortalAssets(object):
+# Common vendor / autoload assets included on every page
+COMMON = {
+    'css': [
+        'css/vendor/jquery-ui-1.11.4.css',
+        'css/vendor/bootstrap-theme.min.css',
+        'css/vendor/bootstrap.min.css',
+        'css/vendor/bootstrap-toggle.min.css',
+        'css/vendor/animate.min.css',
+        'css/vendor/font-awesome.min.css',
+        'css/vendor/keen-dashboards.css',
+        'css/vendor/gridstack.min.css',
+        'css/global.css'
+    ],
+    'js': [
+        'js/vendor/jquery/jquery-2.1.0.min.js',
+        'js/vendor/jquery/jquery-ui-1.11.4.min.js',
+        'js/vendor/jquery/jquery.actual.min.js',
+        'js/vendor/jquery/jquery-ui-touch-punch.min.js',
+        'js/vendor/cookie.js',
+        'js/vendor/bootstrap.min.js',
+        'js/vendor/bootstrap-notify.min.js',
+        'js/vendor/bootstrap-show-password.min.js',
+        'js/vendor/bootstrap-waitingfor.min.js',
+        'js/vendor/bootstrap-toggle.min.js',
+        'js/vendor/handlerbars-4.0.5.min.js',
+        'js/vendor/lodash-4.13.1.min.js',
+        'js/vendor/gridstack.js',
+        'js/lense/prototype.js',
+        'js/lense/exceptions.js',
+        'js/lense/utils.js',
+        'js/lense/core.js'
+    ]
+}
+
+# Fingerprinted asset bundles
+BUNDLE = Collection.create({
+    'path': 'bundle',
+    'manifest': 'manifest.json'
+})
+
+class AssetWatcher(object):
     """
-    Construct portal assets.
+    Detect changes to the static asset directories, either by polling the
+    modification time and size of every file in them or with inotify.
     """
-    def __init__(self):
+    def __init__(self, paths, mode='poll', interval=2):
+        self.paths    = paths
+        self.mode     = mode
+        self.interval = interval
 
-        # JavaScript / CSS assets
-        self._js        = {'core': [], 'handler': None}
-        self._css       = {'core': [], 'handler': []}
+        # Last seen state / last poll time
+        self._mtimes  = self._stat()
+        self._checked = time()
+        self._dirty   = False
 
-        # Handlerbars templates
-        self._templates = []
+        # Start the inotify watcher if requested
+        if self.mode == 'inotify':
+            self._notify()
 
-        # Request handler
-        self.handler    = None
+    def _stat(self):
+        """
+        Return the modification time and size of every file in the watched
+        directories, so in-place edits are seen as well as added and removed
+        files.
+        """
+        state = []
+        for path in self.paths:
+            if not os.path.isdir(path):
+                state.append((path, None))
+                continue
+            for name in sorted(os.listdir(path)):
+                try:
+                    stat = os.stat(os.path.join(path, name))
+                except OSError:
+                    continue
+                state.append((path, name, stat.st_mtime, stat.st_size))
+        return tuple(state)
 
-    def log(self, msg, level='info'):
+    def _notify(self):
         """
-        Log wrapper per handler.
+        Watch asset directories with inotify, falling back to polling if the
+        pyinotify library is not available.
         """
-        logger = getattr(LENSE.LOG, level, 'info')
-        logger('<ASSETS.{0}> {1}'.format(
-            LENSE.REQUEST.path,
-            msg
-        ))
+        try:
+            import pyinotify
+        except ImportError:
+            LENSE.LOG.error('<ASSETS> pyinotify not available, falling back to mtime polling')
+            self.mode = 'poll'
+            return
+
+        # Flag the manifest as dirty on any directory change
+        watcher = self
+        class Handler(pyinotify.ProcessEvent):
+            def process_default(self, event):
+                watcher._dirty = True
+
+        # Start the notifier thread
+        manager  = pyinotify.WatchManager()
+        notifier = pyinotify.ThreadedNotifier(manager, Handler())
+        notifier.daemon = True
+        notifier.start()
+        mask = pyinotify.IN_CREATE | pyinotify.IN_DELETE | pyinotify.IN_MOVED_FROM | pyinotify.IN_MOVED_TO | pyinotify.IN_CLOSE_WRITE
+        for path in self.paths:
+            if os.path.isdir(path):
+                manager.add_watch(path, mask)
 
-    def _get_HandlebarsAssets(self):
+    def changed(self):
         """
-        Retrieve all available Handlebars.js template assets.
+        Check if any watched directory has changed since the last check.
         """
-        template_dir = '{0}/templates/handlebars'.format(SHARE.PORTAL)
-        templates    = []
+        if self.mode == 'frozen':
+            return False
 
-        # Get template assets
-        self.log('Retrieving Handlebars.js template assets from: {0}'.format(template_dir))
-        for template in LENSE.FS.listdir(template_dir):
-            templates.append(template.replace('.html.handlebars', ''))
-            self.log('Discovered template asset: {0}'.format(template))
+        # Inotify events
+        if self.mode == 'inotify':
+            dirty, self._dirty = self._dirty, False
+            return dirty
 
-        # Store templates
-        self._templates = templates
+        # Poll at most once per interval
+        now = time()
+        if (now - self._checked) < self.interval:
+            return False
+        self._checked = now
 
-    def _get_HandlerAssets(self):
+        # Compare file modification times and sizes
+        mtimes = self._stat()
+        if mtimes != self._mtimes:
+            self._mtimes = mtimes
+            return True
+        return False
+
+class AssetManifest(object):
+    """
+    Process level manifest of static assets for every portal handler. The
+    manifest is computed once and only rebuilt when the share directory
+    changes, or never in production mode.
+    """
+
+    # Shared manifest / watcher / generation / build lock
+    _manifest   = None
+    _watcher    = None
+    _generation = None
+    _lock       = Lock()
+
+    @staticmethod
+    def _listdir(path):
         """
-        Retrieve all assets for the current request path handler.
+        Return a sorted list of files in an asset directory.
         """
-        asset_dir     = '{0}/handlers/{1}'.format(STATIC.JS, self.handler)
-        asset_relpath = 'js/lense/handlers/{0}'.format(self.handler)
-        assets        = []
+        return sorted(LENSE.FS.listdir(path)) if os.path.isdir(path) else []
 
-        # Get handler JavaScript assets
-        self.log('Retrieving handler JavaScript assets from: {0}'.format(asset_dir))
-        for asset in LENSE.FS.listdir(asset_dir):
-            assets.append(asset)
-            self.log('Discovered JavaScript asset: {0}/{1}'.format(asset_relpath, asset))
+    @staticmethod
+    def _paths(handlers):
+        """
+        Return all directories that contribute to the manifest.
+        """
+        paths = [getattr(CORE.JS, k).path for k in CORE.JS._fields]
+        paths.extend(['{0}/handlers/{1}'.format(STATIC.JS, h) for h in handlers])
+        paths.extend([STATIC.CSS, STATIC.TEMPLATES, STATIC.BUNDLE])
 
-        # Interface required
-        LENSE.ensure(('interface.js' in assets), isnot = False, error = 'Handler must have a JavaScript interface')
+        # Directories of the common assets included on every page
+        for relpath in COMMON['js'] + COMMON['css']:
+            path = os.path.dirname('{0}/static/{1}'.format(SHARE.PORTAL, relpath))
+            if not path in paths:
+                paths.append(path)
+        return paths
 
-        # Store assets
-        self._js['handler'] = ['{0}/{1}'.format(asset_relpath, x) for x in assets]
+    @staticmethod
+    def _stamp(path):
+        """
+        Return the modification time and size of an asset file.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime, stat.st_size)
+
+    @staticmethod
+    def _bundles():
+        """
+        Load the fingerprinted bundle manifest if bundles have been built and
+        are enabled.
+        """
+        manifest = '{0}/{1}'.format(STATIC.BUNDLE, BUNDLE.manifest)
+        if not option('portal.assets.bundle', True) or not os.path.isfile(manifest):
+            return None
+        with open(manifest, 'r') as f:
+            return json.load(f)
 
-    def _get_CoreAssets(self):
+    @classmethod
+    def build(cls, routes):
         """
-        Retrieve core static assets for the current request path handler.
+        Construct the asset manifest for all handlers in the route table.
+
+        :param routes: The portal route table
+        :type  routes: PortalRoutes
         """
+        manifest = {}
 
-        # Get core JavaScript assets
-        for asset_key in CORE.JS._fields:
-            asset_attrs   = getattr(CORE.JS, asset_key)
-            asset_dir     = getattr(asset_attrs, 'path', '{0}/{1}'.format(STATIC.JS, asset_key))
-            asset_relpath = getattr(asset_attrs, 'relpath', '/static/js/lense/{0}'.format(asset_key))
-            asset_exclude = getattr(asset_attrs, 'exclude', [])
+        # Core JavaScript assets / Handlebars templates / stylesheets
+        core      = [(getattr(CORE.JS, k), cls._listdir(getattr(CORE.JS, k).path)) for k in CORE.JS._fields]
+        templates = [t.replace('.html.handlebars', '') for t in cls._listdir(STATIC.TEMPLATES)]
+        css       = cls._listdir(STATIC.CSS)
+        bundles   = cls._bundles()
 
-            # Looking for core assets
-            self.log('Retrieving core JavaScript assets from: {0}'.format(asset_dir))
+        # Construct each handler manifest
+        for name, route in routes.iteritems():
+            handler_js = cls._listdir('{0}/handlers/{1}'.format(STATIC.JS, name))
 
-            # Load asset files
-            for asset in LENSE.FS.listdir(asset_dir):
-                asset_path = '{0}/{1}'.format(asset_relpath, asset)
+            # Interface required
+            if not 'interface.js' in handler_js:
+                LENSE.LOG.error('<ASSETS> Handler "{0}" has no JavaScript interface, skipping'.format(name))
+                continue
 
-                # If excluding asset
-                if LENSE.REQUEST.path in asset_exclude:
-                    self.log('Excluding core JavaScript asset: {0}, in_path={1}'.format(asset_path, LENSE.REQUEST.path))
+            # Core assets, excluding those not used by this handler
+            js = []
+            for attrs, assets in core:
+                if name in getattr(attrs, 'exclude', []):
                     continue
+                js.extend(['{0}/{1}'.format(attrs.relpath, a) for a in assets])
 
-                # Store the asset
-                self._js['core'].append(asset_path)
-                self.log('Discovered core JavaScript asset: {0}'.format(asset_path))
+            # Store the handler manifest
+            manifest[name] = {
+                'js': js + ['{0}/{1}'.format(route.assets.js, a) for a in handler_js],
+                'css': [route.assets.css] if os.path.basename(route.assets.css) in css else [],
+                'templates': templates,
+                'common': COMMON,
+                'bundle': None
+            }
 
-    def _get_assets(self):
+            # Fingerprinted bundles
+            if bundles and (name in bundles['handlers']):
+                manifest[name]['bundle'] = {
+                    'js': [bundles['common']['js'], bundles['handlers'][name]['js']],
+                    'css': [bundles['common']['css'], bundles['handlers'][name]['css']]
+                }
+
+                # Templates are served by the compiled template module
+                if bundles.get('templates'):
+                    manifest[name]['bundle']['js'].insert(1, bundles['templates'])
+                    manifest[name]['templates'] = []
+
+        # Manifest version, from the asset names and the state of every asset file
+        files = set(COMMON['js'] + COMMON['css'])
+        for attrs in manifest.values():
+            files.update(attrs['js'] + attrs['css'])
+        stamps = [(f, cls._stamp('{0}/static/{1}'.format(SHARE.PORTAL, f))) for f in sorted(files)]
+        stamps.extend([(t, cls._stamp('{0}/{1}.html.handlebars'.format(STATIC.TEMPLATES, t))) for t in templates])
+        version = sha1(repr([sorted(manifest.items()), stamps])).hexdigest()[:12]
+        for name in manifest:
+            manifest[name]['version'] = version
+
+        LENSE.LOG.info('<ASSETS> Constructed asset manifest: version={0}, handlers={1}'.format(version, ', '.join(sorted(manifest.keys()))))
+        return manifest
+
+    @classmethod
+    def watcher(cls, routes):
         """
-        Retrieve static assets for the current request path handler.
+        Construct the asset directory watcher.
         """
-        self._get_CoreAssets()
-        self._get_HandlerAssets()
-        self._get_HandlebarsAssets()
+        mode = 'frozen' if production() else option('portal.assets.watch', 'poll')
+        return AssetWatcher(cls._paths(routes.keys()), mode=mode, interval=option('portal.assets.interval', 2))
 
-    def construct(self):
+    @classmethod
+    def invalidate(cls):
         """
-        Construct and return static assets for the current request handler.
+        Rebuild the manifest in every portal process on next use.
         """
+        CacheGenerations.bump('assets')
 
-        # Get all assets
-        self._get_assets()
+    @classmethod
+    def load(cls):
+        """
+        Return the shared asset manifest, rebuilding it if the asset
+        directories have changed or the manifest was invalidated.
+        """
+        generation = CacheGenerations.get('assets')
+        if (cls._manifest is None) or (cls._generation != generation) or cls._watcher.changed():
+            with cls._lock:
+                routes = PortalRoutes.load()
+                if cls._watcher is None:
+                    cls._watcher = cls.watcher(routes)
+                cls._manifest   = cls.build(routes)
+                cls._generation = generation
+        return cls._manifest
 
-        # Return constructed assets
-        return {
-            'js':  self._js['core'] + self._js['handler'],
-            'css': self._css['core'] + self._css['handler'],
-            'templates': self._templates
-        }
+    @classmethod
+    def get(cls, handler):
+        """
+        Return the asset manifest for a handler.
+
+        :param handler: The handler name
+        :type  handler: str
+        """
+        manifest = cls.load()
+
+        # Handler must have a manifest
+        LENSE.ensure((handler in manifest), isnot = False, error = 'Handler must have a JavaScript interface')
+        return manifest[handler]
+
+class PortalAssets(object):
+    """
+    Construct portal assets.
+    """
+    def __init__(self):
+
+        # Request handler
+        self.handler = None
+
+    def construct(self):
+        """
+        Construct and return static assets for the current request handler.
+        """
+        with timed('assets'):
+            return AssetManifest.get(self.handler)
@@ -0,0 +1,200 @@
+import re
+import os
+import json
+import gzip
+from time import time
+from hashlib import sha1
+
+# Lense Libraries
+from lense.common.vars import SHARE
+from lense.portal.ui.core.log import PortalLog
+from lense.portal.ui.core.config import option
+from lense.portal.ui.core.routes import PortalRoutes
+from lense.portal.ui.core.handlebars import HandlebarsCompiler
+from lense.portal.ui.core.assets import COMMON, BUNDLE, AssetManifest
+
+# Optional minifiers / compressors
+try:
+    from rjsmin import jsmin
+except ImportError:
+    jsmin = None
+try:
+    from rcssmin import cssmin
+except ImportError:
+    cssmin = None
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Relative CSS url() references
+CSS_URL = re.compile(r'url\(\s*([\'"]?)(?!data:|https?:|/|#)([^\'")]+)\1\s*\)')
+
+class AssetBundler(object):
+    """
+    Concatenate, minify and fingerprint static assets into per-handler
+    bundles with precompressed variants.
+    """
+    def __init__(self, minify=True, compress=True):
+        self.minify   = minify
+        self.compress = compress
+
+        # Static root / bundle output directory
+        self.static   = '{0}/static'.format(SHARE.PORTAL)
+        self.output   = '{0}/{1}'.format(self.static, BUNDLE.path)
+
+        # Written bundle files
+        self.written  = []
+
+    def log(self, msg, level='info'):
+        """
+        Log wrapper for the asset bundler.
+        """
+        PortalLog.write(level, '<BUNDLE>', msg)
+
+    def _read(self, relpath):
+        """
+        Read a static asset relative to the static root.
+        """
+        with open('{0}/{1}'.format(self.static, relpath), 'rb') as f:
+            return f.read()
+
+    def _css(self, relpath):
+        """
+        Read a stylesheet, rewriting relative url() references to absolute
+        static paths so they resolve from the bundle directory.
+        """
+        base = os.path.dirname(relpath)
+        def rewrite(m):
+            return 'url({0}{1}{0})'.format(m.group(1), os.path.normpath('/static/{0}/{1}'.format(base, m.group(2))))
+        return CSS_URL.sub(rewrite, self._read(relpath))
+
+    def _minify(self, ext, content):
+        """
+        Minify bundle content if a minifier is available.
+        """
+        if not self.minify:
+            return content
+        if ext == 'js' and jsmin:
+            return jsmin(content)
+        if ext == 'css' and cssmin:
+            return cssmin(content)
+        return content
+
+    def _write(self, name, ext, content):
+        """
+        Write a fingerprinted bundle and its precompressed variants.
+
+        :param    name: The bundle name
+        :type     name: str
+        :param     ext: The bundle extension (js/css)
+        :type      ext: str
+        :param content: The bundle content
+        :type  content: str
+        """
+        content  = self._minify(ext, content)
+        filename = '{0}.{1}.{2}'.format(name, sha1(content).hexdigest()[:12], ext)
+        path     = '{0}/{1}'.format(self.output, filename)
+
+        # Bundle content
+        with open(path, 'wb') as f:
+            f.write(content)
+
+        # Precompressed variants
+        if self.compress:
+            with open('{0}.gz'.format(path), 'wb') as f:
+                with gzip.GzipFile(filename='', mode='wb', fileobj=f, compresslevel=9, mtime=0) as gz:
+                    gz.write(content)
+            if brotli:
+                with open('{0}.br'.format(path), 'wb') as f:
+                    f.write(brotli.compress(content))
+
+        self.written.append(filename)
+        self.log('Wrote bundle: {0} ({1} bytes)'.format(filename, len(content)))
+        return '{0}/{1}'.format(BUNDLE.path, filename)
+
+    def _bundle(self, name, js, css):
+        """
+        Construct a JavaScript and CSS bundle pair.
+        """
+        return {
+            'js': self._write(name, 'js', '\n;'.join([self._read(p) for p in js])),
+            'css': self._write(name, 'css', '\n'.join([self._css(p) for p in css]))
+        }
+
+    def _previous(self):
+        """
+        Return the bundle file names referenced by the current manifest.
+        """
+        try:
+            with open('{0}/{1}'.format(self.output, BUNDLE.manifest), 'r') as f:
+                manifest = json.load(f)
+        except (IOError, ValueError):
+            return []
+        paths = [manifest.get('templates')] + manifest.get('common', {}).values()
+        for bundle in manifest.get('handlers', {}).values():
+            paths.extend(bundle.values())
+        return [os.path.basename(p) for p in paths if p]
+
+    def _clean(self, previous):
+        """
+        Remove stale bundles from previous builds. Bundles replaced by this
+        build are kept for a grace period, since cached pages and browsers
+        may still reference them.
+
+        :param previous: Bundle file names referenced by the replaced manifest
+        :type  previous: list
+        """
+        now   = time()
+        grace = option('portal.assets.bundle_grace', 3600)
+        for filename in os.listdir(self.output):
+            name = filename.split('.gz')[0].split('.br')[0]
+            if name in self.written or filename == BUNDLE.manifest:
+                continue
+            path = '{0}/{1}'.format(self.output, filename)
+
+            # Replaced by this build, start the grace period
+            if name in previous:
+                os.utime(path, None)
+                continue
+
+            # Still within the grace period
+            if now - os.path.getmtime(path) < grace:
+                continue
+            os.remove(path)
+            self.log('Removed stale bundle: {0}'.format(filename))
+
+    def build(self):
+        """
+        Build the common bundle, the compiled Handlebars template module and a
+        bundle for each portal handler.
+        """
+        if not os.path.isdir(self.output):
+            os.makedirs(self.output)
+
+        # Warn if minifiers are missing
+        if self.minify and not (jsmin and cssmin):
+            self.log('rjsmin/rcssmin not available, bundles will not be minified')
+
+        # Bundles referenced by the manifest being replaced
+        previous = self._previous()
+
+        # Bundle manifest
+        manifest = {
+            'common': self._bundle('common', COMMON['js'], COMMON['css']),
+            'templates': self._write('templates', 'js', HandlebarsCompiler().compile()),
+            'handlers': {}
+        }
+
+        # Handler bundles
+        for name in sorted(PortalRoutes.load().keys()):
+            assets = AssetManifest.get(name)
+            manifest['handlers'][name] = self._bundle(name, assets['js'], assets['css'])
+
+        # Write the bundle manifest
+        with open('{0}/{1}'.format(self.output, BUNDLE.manifest), 'w') as f:
+            json.dump(manifest, f, indent=4, sort_keys=True)
+
+        # Remove old bundles
+        self._clean(previous)
+        return manifest
@@ -0,0 +1,331 @@
+import os
+import pwd
+import mmap
+import fcntl
+import struct
+from time import time
+from zlib import crc32
+from hashlib import sha1
+from threading import Lock, RLock
+from collections import OrderedDict
+
+# Lense Libraries
+from lense.portal.ui.core.config import option
+
+# Cache backends stored outside of the process
+SHARED = ['memcached']
+
+class TTLCache(object):
+    """
+    Thread safe, size bounded LRU cache with per-entry expiration.
+    """
+    def __init__(self, size=1024, ttl=60):
+        self.size    = size
+        self.ttl     = ttl
+
+        # Cached entries: key -> (expires, value)
+        self._data   = OrderedDict()
+        self._lock   = RLock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return self.get(key, None) is not None
+
+    def get(self, key, default=None):
+        """
+        Retrieve a cached value, refreshing its position in the LRU order.
+
+        :param     key: The cache key
+        :type      key: hashable
+        :param default: The value to return on a miss
+        :type  default: mixed
+        """
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if (entry is None) or (entry[0] < time()):
+                return default
+            self._data[key] = entry
+            return entry[1]
+
+    def set(self, key, value, ttl=None):
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        :param   key: The cache key
+        :type    key: hashable
+        :param value: The value to cache
+        :type  value: mixed
+        :param   ttl: Override the default time to live in seconds
+        :type    ttl: int
+        """
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (time() + (self.ttl if ttl is None else ttl), value)
+            while len(self._data) > self.size:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        """
+        Remove a cached value.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate_tag(self, tag):
+        """
+        Remove all cached values whose key is a tuple starting with a tag.
+
+        :param tag: The first element of the key
+        :type  tag: hashable
+        """
+        self.invalidate(lambda k: isinstance(k, tuple) and k[0] == tag)
+
+    def invalidate(self, match):
+        """
+        Remove all cached values whose key matches a filter.
+
+        :param match: Filter method called with each key
+        :type  match: callable
+        """
+        with self._lock:
+            for key in [k for k in self._data.keys() if match(k)]:
+                del self._data[key]
+
+    def clear(self):
+        """
+        Remove all cached values.
+        """
+        with self._lock:
+            self._data.clear()
+
+class CacheGenerations(object):
+    """
+    Generation counters kept in a memory mapped file on a shared memory
+    filesystem, so bumping a generation in one process invalidates every
+    entry stored under the previous generation in all processes. Falls back
+    to process local counters if the file cannot be mapped.
+
+    Names are hashed into a fixed number of slots. Names sharing a slot
+    share a counter, so bumping one, e.g. invalidating one user's tag, also
+    invalidates entries stored under the other. A collision only causes
+    spurious cache misses, never stale hits, and with one tag per user the
+    chance that a given user shares a slot is about users / SLOTS.
+    """
+
+    # Number of 8 byte counter slots (512KiB)
+    SLOTS   = 65536
+    COUNTER = struct.Struct('<Q')
+
+    # Generations file descriptor / shared memory map / local fallback
+    _fd     = None
+    _map    = None
+    _local  = None
+    _lock   = Lock()
+
+    @classmethod
+    def _open(cls):
+        """
+        Map the generations file, creating it if needed.
+        """
+        path = option('portal.cache.generations', '/dev/shm/lense-portal-cache.gen')
+        size = cls.SLOTS * cls.COUNTER.size
+        fd   = None
+        try:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o660)
+            cls._own(fd)
+            if os.fstat(fd).st_size < size:
+                os.ftruncate(fd, size)
+            cls._map = mmap.mmap(fd, size, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
+            cls._fd  = fd
+        except (IOError, OSError, KeyError, ValueError, mmap.error) as e:
+            LENSE.LOG.warning('<CACHE> Failed to map cache generations "{0}", using process local counters: {1}'.format(path, e))
+            if fd is not None:
+                os.close(fd)
+            cls._local = {}
+
+    @staticmethod
+    def _own(fd):
+        """
+        Apply the configured mode and owner to the generations file, so a
+        file created by a management command running as root can still be
+        mapped by the portal processes.
+
+        :param fd: The generations file descriptor
+        :type  fd: int
+        """
+        stat = os.fstat(fd)
+        if os.geteuid() not in [0, stat.st_uid]:
+            return
+        os.fchmod(fd, int(str(option('portal.cache.generations_mode', '0660')), 8))
+
+        # Only root can change the owner
+        user = option('portal.cache.generations_user', 'www-data')
+        if user and (os.geteuid() == 0):
+            pw = pwd.getpwnam(user)
+            os.fchown(fd, pw.pw_uid, pw.pw_gid)
+
+    @classmethod
+    def shared(cls):
+        """
+        Check if generations are shared between processes, i.e. the
+        generations file could be mapped.
+        """
+        return cls._mapped()
+
+    @classmethod
+    def _mapped(cls):
+        """
+        Check if the generations file is mapped, opening it on first use.
+        """
+        if (cls._map is None) and (cls._local is None):
+            with cls._lock:
+                if (cls._map is None) and (cls._local is None):
+                    cls._open()
+        return cls._map is not None
+
+    @classmethod
+    def _slot(cls, name):
+        """
+        Return the byte offset of the counter for a name.
+        """
+        return ((crc32(name) & 0xffffffff) % cls.SLOTS) * cls.COUNTER.size
+
+    @classmethod
+    def get(cls, name):
+        """
+        Return the current generation for a name.
+
+        :param name: The generation name
+        :type  name: str
+        """
+        if not cls._mapped():
+            return cls._local.get(cls._slot(name), 0)
+        return cls.COUNTER.unpack_from(cls._map, cls._slot(name))[0]
+
+    @classmethod
+    def bump(cls, name):
+        """
+        Increment the generation for a name in every process.
+
+        :param name: The generation name
+        :type  name: str
+        """
+        slot   = cls._slot(name)
+        mapped = cls._mapped()
+        with cls._lock:
+            if not mapped:
+                cls._local[slot] = cls._local.get(slot, 0) + 1
+                return
+
+            # Serialize increments between processes
+            fcntl.lockf(cls._fd, fcntl.LOCK_EX)
+            try:
+                cls.COUNTER.pack_into(cls._map, slot, cls.COUNTER.unpack_from(cls._map, slot)[0] + 1)
+            finally:
+                fcntl.lockf(cls._fd, fcntl.LOCK_UN)
+
+class SharedCache(object):
+    """
+    Cache shared between processes, stored in the "shared" Django cache
+    backend. Keys are namespaced and carry the namespace and tag
+    generations, so clearing the namespace or invalidating a tag in one
+    process applies to all of them. Eviction is left to the backend.
+    """
+    def __init__(self, namespace, ttl=60, alias='shared'):
+        self.namespace = namespace
+        self.ttl       = ttl
+        self.alias     = alias
+
+    @property
+    def backend(self):
+        """
+        Return the Django cache backend for the current thread.
+        """
+        from django.core.cache import caches
+        return caches[self.alias]
+
+    def _tag(self, tag):
+        """
+        Return the generation name for a key tag.
+        """
+        return '{0}:{1}'.format(self.namespace, sha1(repr(tag)).hexdigest())
+
+    def _key(self, key):
+        """
+        Return the backend key for a cache key.
+
+        :param key: The cache key, tuple keys are tagged by their first element
+        :type  key: hashable
+        """
+        return 'lense:{0}:{1}:{2}:{3}'.format(
+            self.namespace,
+            CacheGenerations.get(self.namespace),
+            0 if not isinstance(key, tuple) else CacheGenerations.get(self._tag(key[0])),
+            sha1(repr(key)).hexdigest()
+        )
+
+    def __contains__(self, key):
+        return self.get(key, None) is not None
+
+    def get(self, key, default=None):
+        """
+        Retrieve a cached value.
+
+        :param     key: The cache key
+        :type      key: hashable
+        :param default: The value to return on a miss
+        :type  default: mixed
+        """
+        return self.backend.get(self._key(key), default)
+
+    def set(self, key, value, ttl=None):
+        """
+        Store a value.
+
+        :param   key: The cache key
+        :type    key: hashable
+        :param value: The value to cache
+        :type  value: mixed
+        :param   ttl: Override the default time to live in seconds
+        :type    ttl: int
+        """
+        self.backend.set(self._key(key), value, self.ttl if ttl is None else ttl)
+
+    def delete(self, key):
+        """
+        Remove a cached value.
+        """
+        self.backend.delete(self._key(key))
+
+    def invalidate_tag(self, tag):
+        """
+        Remove all cached values whose key is a tuple starting with a tag.
+
+        :param tag: The first element of the key
+        :type  tag: hashable
+        """
+        CacheGenerations.bump(self._tag(tag))
+
+    def clear(self):
+        """
+        Remove all cached values in the namespace.
+        """
+        CacheGenerations.bump(self.namespace)
+
+def create_cache(namespace, size=1024, ttl=60):
+    """
+    Return a cache for a namespace, shared between processes if a shared
+    backend is configured and local to the process otherwise.
+
+    :param namespace: The cache namespace
+    :type  namespace: str
+    :param      size: The maximum number of entries in a local cache
+    :type       size: int
+    :param       ttl: The default time to live in seconds
+    :type        ttl: int
+    """
+    if option('portal.cache.backend', 'local') in SHARED:
+        return SharedCache(namespace, ttl=ttl)
+    return TTLCache(size=size, ttl=ttl)
@@ -0,0 +1,22 @@
+def option(path, default=None):
+    """
+    Retrieve an optional configuration value from the project configuration,
+    falling back to a default if any part of the path is missing.
+
+    :param    path: The dotted configuration path, i.e. 'portal.assets.watch'
+    :type     path: str
+    :param default: The value to return if the option is not set
+    :type  default: mixed
+    """
+    value = LENSE.CONF
+    for key in path.split('.'):
+        value = getattr(value, key, None)
+        if value is None:
+            return default
+    return value
+
+def production():
+    """
+    Check if the portal is running in production mode.
+    """
+    return bool(option('portal.production', False))
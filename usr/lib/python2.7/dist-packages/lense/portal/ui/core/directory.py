@@ -0,0 +1,143 @@
+import os
+from time import time
+from threading import Lock
+
+# Lense Libraries
+from lense.portal.ui.core.log import PortalLog
+from lense.portal.ui.core.cache import create_cache
+from lense.portal.ui.core.config import option
+from lense.portal.ui.core.timing import timed
+
+class PortalLDAPSearch(object):
+    """
+    LDAP user search used by the authentication backend. The search is
+    constructed from the group map on first use, and rebuilt only when the
+    group map file changes. Search results are cached per filter with a
+    short TTL, and lookups which matched nothing for a shorter negative TTL.
+    """
+    def __init__(self, construct, path=None):
+
+        # Search constructor / group map file
+        self._construct = construct
+        self.path       = path
+
+        # Constructed search / group map modification time / last check
+        self._search    = None
+        self._mtime     = None
+        self._checked   = 0
+        self._lock      = Lock()
+
+        # Search results cache
+        self._cache      = None
+        self._cache_lock = Lock()
+
+    def log(self, msg, level='info', **fields):
+        """
+        Write an LDAP log message.
+        """
+        PortalLog.write(level, '<LDAP>', msg, **fields)
+
+    def _stat(self):
+        """
+        Return the modification time of the group map file.
+        """
+        try:
+            return None if not self.path else os.path.getmtime(self.path)
+        except OSError:
+            return None
+
+    def _stale(self, now):
+        """
+        Check if the group map should be checked for changes.
+        """
+        return (self._search is None) or (now - self._checked > option('portal.ldap.map_interval', 30))
+
+    def search(self):
+        """
+        Return the constructed search, rebuilding it if the group map file
+        has changed since it was constructed.
+        """
+        now = time()
+        if self._stale(now):
+            with self._lock:
+                if self._stale(now):
+                    mtime = self._stat()
+                    if (self._search is None) or (mtime != self._mtime):
+                        changed = self._search is not None
+                        with timed('ldap_map'):
+                            self._search = self._construct()
+                        self._mtime = mtime
+
+                        # Results shared with other processes are only stale if the map changed
+                        if changed:
+                            self.cache().clear()
+                        self.log('Constructed user search from group map', path=self.path, changed=changed)
+                    self._checked = now
+        return self._search
+
+    def cache(self):
+        """
+        Return the search results cache.
+        """
+        if self._cache is None:
+            with self._cache_lock:
+                if self._cache is None:
+                    self._cache = create_cache('ldap',
+                        size = option('portal.ldap.cache_size', 1024),
+                        ttl  = option('portal.ldap.cache_ttl', 60)
+                    )
+        return self._cache
+
+    @staticmethod
+    def _key(filterargs, escape):
+        """
+        Cache key for a search, tagged by the searched username.
+        """
+        user = filterargs.get('user') if isinstance(filterargs, dict) else None
+        return (('user', user), repr(sorted(filterargs.items()) if isinstance(filterargs, dict) else filterargs), escape)
+
+    def invalidate(self, username=None):
+        """
+        Drop cached search results for a user, or all cached results.
+
+        :param username: The username to invalidate
+        :type  username: str
+        """
+        if username:
+            self.cache().invalidate_tag(('user', username))
+        else:
+            self.cache().clear()
+
+    def execute(self, connection, filterargs=(), escape=True):
+        """
+        Execute the user search, answering from the results cache if
+        possible.
+
+        :param  connection: A bound LDAP connection
+        :type   connection: LDAPObject
+        :param  filterargs: Values substituted into the search filter
+        :type   filterargs: dict|tuple
+        :param      escape: Escape the filter values
+        :type       escape: bool
+        """
+        search  = self.search()
+        key     = self._key(filterargs, escape)
+        cache   = self.cache()
+        results = cache.get(key)
+        if results is not None:
+            self.log('Search cache hit', level='debug', filterargs=filterargs, results=len(results))
+            return results
+
+        # Query the directory
+        started = time()
+        with timed('ldap_search'):
+            results = search.execute(connection, filterargs, escape)
+        self.log('Search completed', level='debug', filterargs=filterargs, results=len(results),
+            ms=lambda: '{0:.1f}'.format((time() - started) * 1000))
+
+        # Lookups which matched nothing are cached for a shorter time
+        cache.set(key, results, ttl=None if results else option('portal.ldap.negative_ttl', 10))
+        return results
+
+    def __getattr__(self, name):
+        return getattr(self.search(), name)
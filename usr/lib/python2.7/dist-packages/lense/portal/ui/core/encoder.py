@@ -0,0 +1,45 @@
+import json
+
+# Optional fast JSON encoder
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# Characters escaped so JSON can be embedded in a script element
+ESCAPES = [
+    ('<', '\\u003c'),
+    ('>', '\\u003e'),
+    ('&', '\\u0026'),
+    (u'\u2028', '\\u2028'),
+    (u'\u2029', '\\u2029')
+]
+
+def dumps(obj):
+    """
+    Serialize an object to compact JSON, using the fast encoder if it is
+    available and falling back to the standard library for values it does
+    not support.
+
+    :param obj: The object to serialize
+    :type  obj: object
+    """
+    if ujson:
+        try:
+            return ujson.dumps(obj, ensure_ascii=True, escape_forward_slashes=False)
+        except (TypeError, OverflowError, ValueError):
+            pass
+    return json.dumps(obj, separators=(',', ':'), default=str)
+
+def script_dumps(obj):
+    """
+    Serialize an object to JSON which is safe to embed in a script element
+    or inline JavaScript.
+
+    :param obj: The object to serialize
+    :type  obj: object
+    """
+    data = dumps(obj)
+    for char, escaped in ESCAPES:
+        data = data.replace(char, escaped)
+    return data
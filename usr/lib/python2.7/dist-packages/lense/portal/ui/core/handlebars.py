@@ -0,0 +1,103 @@
+import re
+import os
+import json
+import shutil
+import tempfile
+from subprocess import check_output, CalledProcessError
+from distutils.spawn import find_executable
+
+# Lense Libraries
+from lense.portal.ui.core.log import PortalLog
+from lense.portal.ui.core.assets import STATIC
+
+# Django verbatim tags wrapping inline templates
+VERBATIM = re.compile(r'{%\s*(end)?verbatim\s*%}')
+
+# Template extension
+EXTENSION = '.html.handlebars'
+
+class HandlebarsCompiler(object):
+    """
+    Compile all Handlebars templates into a single JavaScript module which
+    registers each template on Handlebars.templates.
+    """
+    def __init__(self, path=STATIC.TEMPLATES):
+        self.path = path
+
+        # Handlebars command line compiler
+        self.cli  = find_executable('handlebars')
+
+    def log(self, msg, level='info'):
+        """
+        Log wrapper for the template compiler.
+        """
+        PortalLog.write(level, '<HANDLEBARS>', msg)
+
+    def sources(self):
+        """
+        Return template sources keyed by template name.
+        """
+        sources = {}
+        for filename in sorted(os.listdir(self.path)):
+            if not filename.endswith(EXTENSION):
+                continue
+            with open('{0}/{1}'.format(self.path, filename), 'r') as f:
+                sources[filename.replace(EXTENSION, '')] = VERBATIM.sub('', f.read()).strip()
+        return sources
+
+    def _precompile(self, sources):
+        """
+        Precompile templates with the Handlebars command line compiler.
+        """
+        tmpdir = tempfile.mkdtemp()
+        try:
+            for name, source in sources.iteritems():
+                with open('{0}/{1}.handlebars'.format(tmpdir, name), 'w') as f:
+                    f.write(source)
+            return check_output([self.cli, tmpdir, '--extension', 'handlebars'])
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def _deferred(self, sources):
+        """
+        Construct a module which registers a getter for each template,
+        compiling the template on first access and replacing the getter with
+        the compiled template.
+        """
+        return '\n'.join([
+            '(function() {',
+            '  var templates = Handlebars.templates = Handlebars.templates || {};',
+            '  var sources = {0};'.format(json.dumps(sources, sort_keys=True)),
+            '  function define(name, value) {',
+            '    Object.defineProperty(templates, name, { value: value, writable: true, enumerable: true, configurable: true });',
+            '    return value;',
+            '  }',
+            '  Object.keys(sources).forEach(function(name) {',
+            '    Object.defineProperty(templates, name, {',
+            '      get: function() { return define(name, Handlebars.compile(sources[name])); },',
+            '      set: function(value) { define(name, value); },',
+            '      enumerable: true,',
+            '      configurable: true',
+            '    });',
+            '  });',
+            '})();'
+        ])
+
+    def compile(self):
+        """
+        Return the compiled template module.
+        """
+        sources = self.sources()
+
+        # Precompile if the Handlebars compiler is installed
+        if self.cli:
+            try:
+                module = self._precompile(sources)
+                self.log('Precompiled {0} templates with: {1}'.format(len(sources), self.cli))
+                return module
+            except (CalledProcessError, OSError) as e:
+                self.log('Failed to precompile templates, deferring compilation: {0}'.format(str(e)), level='error')
+
+        # Compile on first use in the browser
+        self.log('Handlebars compiler not available, templates will be compiled on first use')
+        return self._deferred(sources)
@@ -52,7 +52,7 @@ class TemplateInterface(PortalBase):
         for handler in LENSE.MODULE.handlers(ext='__init__'):
             try:
                 import_class('register', handler['mod'])
-                self.log('Registering handler: {0}'.format(handler['mod']), level='debug', method='bootstrap')
+                self.log('Registering handler', level='debug', method='bootstrap', handler=handler['mod'])
             
             # Could not load register method
             except Exception as e:
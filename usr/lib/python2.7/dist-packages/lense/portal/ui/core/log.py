@@ -0,0 +1,74 @@
+import logging
+
+# Lense Libraries
+from lense.portal.ui.core.config import option
+
+# Log method names to levels
+LEVELS = {
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warn': logging.WARNING,
+    'warning': logging.WARNING,
+    'error': logging.ERROR,
+    'exception': logging.ERROR,
+    'critical': logging.CRITICAL
+}
+
+class PortalLog(object):
+    """
+    Level gated logging facade. Message prefixes and structured fields are
+    only evaluated once the level is known to be enabled.
+    """
+
+    # Configured log threshold
+    _threshold = None
+
+    @classmethod
+    def threshold(cls):
+        """
+        Return the configured log threshold.
+        """
+        if cls._threshold is None:
+            cls._threshold = getattr(logging, str(option('portal.log_level', 'INFO')).upper(), logging.INFO)
+        return cls._threshold
+
+    @classmethod
+    def enabled(cls, level):
+        """
+        Check if a log level is enabled.
+
+        :param level: The log method name
+        :type  level: str
+        """
+        return LEVELS.get(level, logging.INFO) >= cls.threshold()
+
+    @staticmethod
+    def _value(value):
+        """
+        Evaluate a deferred value.
+        """
+        return value() if callable(value) else value
+
+    @classmethod
+    def write(cls, level, prefix, msg, **fields):
+        """
+        Write a log message if the level is enabled.
+
+        :param  level: The log method name
+        :type   level: str
+        :param prefix: The message prefix or a callable returning it
+        :type  prefix: str|callable
+        :param    msg: The message to log
+        :type     msg: str
+        :param fields: Structured fields appended as key=value pairs, callable
+                       values are evaluated lazily
+        """
+        if not cls.enabled(level):
+            return
+
+        # Construct the message
+        if fields:
+            msg = '{0}: {1}'.format(msg, ', '.join(['{0}={1}'.format(k, cls._value(v)) for k,v in sorted(fields.iteritems())]))
+
+        # Write the log message
+        getattr(LENSE.LOG, level if level in LEVELS else 'info')('{0} {1}'.format(cls._value(prefix), msg))
@@ -0,0 +1,94 @@
+from copy import deepcopy
+from threading import Lock
+
+# Django Libraries
+from django.utils.safestring import mark_safe
+from django.template.loader import render_to_string
+
+# Lense Libraries
+from lense.portal.ui.core.routes import PortalRoutes
+
+class PortalNavigation(object):
+    """
+    Process level portal navigation, built once from the route table and
+    filtered per permission set.
+    """
+
+    # Ordered navigation / filtered navigation / rendered fragments
+    _navigation = None
+    _filtered   = {}
+    _rendered   = {}
+    _lock       = Lock()
+
+    # Navigation menu fragment template
+    template    = 'core/menu/handlers.html'
+
+    @staticmethod
+    def permissions(admin=False):
+        """
+        Return the permission set for a user.
+
+        :param admin: Is the user an administrator
+        :type  admin: bool
+        """
+        return frozenset(['admin'] if admin else [])
+
+    @staticmethod
+    def _allowed(item, permissions):
+        """
+        Check if a navigation item is visible for a permission set.
+        """
+        return (not item.get('admin', False)) or ('admin' in permissions)
+
+    @classmethod
+    def build(cls):
+        """
+        Construct the ordered navigation from the route table.
+        """
+        navigation = []
+        for name, route in PortalRoutes.load().iteritems():
+            if route.navigation:
+                navigation.append((route.navigation.get('order', 0), name, deepcopy(route.navigation)))
+        LENSE.LOG.info('<NAVIGATION> Constructed portal navigation: {0}'.format(', '.join([n[1] for n in sorted(navigation)])))
+        return tuple([n[2] for n in sorted(navigation)])
+
+    @classmethod
+    def get(cls, admin=False):
+        """
+        Return the navigation visible to a user.
+
+        :param admin: Is the user an administrator
+        :type  admin: bool
+        """
+        permissions = cls.permissions(admin)
+        if not permissions in cls._filtered:
+            with cls._lock:
+                if cls._navigation is None:
+                    cls._navigation = cls.build()
+
+                # Filter parent and child items
+                filtered = []
+                for item in cls._navigation:
+                    if not cls._allowed(item, permissions):
+                        continue
+                    item = dict(item)
+                    if 'children' in item:
+                        item['children'] = [c for c in item['children'] if cls._allowed(c, permissions)]
+                    filtered.append(item)
+                cls._filtered[permissions] = tuple(filtered)
+        return cls._filtered[permissions]
+
+    @classmethod
+    def render(cls, admin=False):
+        """
+        Return the rendered navigation menu fragment for a user.
+
+        :param admin: Is the user an administrator
+        :type  admin: bool
+        """
+        permissions = cls.permissions(admin)
+        if not permissions in cls._rendered:
+            cls._rendered[permissions] = mark_safe(render_to_string(cls.template, {
+                'NAV': cls.get(admin)
+            }))
+        return cls._rendered[permissions]
@@ -0,0 +1,117 @@
+from threading import Lock
+
+# Lense Libraries
+from lense.portal.ui.core.cache import create_cache
+from lense.portal.ui.core.config import option
+
+class PortalPages(object):
+    """
+    Cache of fully rendered pages per user, active group, handler, view and
+    asset/template version. Pages are rendered with a placeholder in place
+    of the CSRF token, which is injected for the requesting session when the
+    page is served, so a cache hit skips controller construction and
+    template rendering entirely.
+    """
+
+    # Placeholder rendered in place of the CSRF token
+    CSRF   = 'LENSE-PORTAL-CSRF-TOKEN'
+
+    # Shared page cache
+    _cache = None
+    _lock  = Lock()
+
+    @classmethod
+    def cache(cls):
+        """
+        Return the shared page cache.
+        """
+        if cls._cache is None:
+            with cls._lock:
+                if cls._cache is None:
+                    cls._cache = create_cache('pages',
+                        size = option('portal.cache.page_size', 2048),
+                        ttl  = option('portal.cache.page_ttl', 30)
+                    )
+        return cls._cache
+
+    @staticmethod
+    def enabled():
+        """
+        Check if rendered pages are cached.
+        """
+        return bool(option('portal.cache.pages', False))
+
+    @classmethod
+    def cacheable(cls):
+        """
+        Check if the current request can be served from or stored in the
+        page cache.
+        """
+        return cls.enabled() and (LENSE.REQUEST.DJANGO.method in ['GET', 'HEAD']) \
+            and LENSE.REQUEST.USER.authorized and (LENSE.REQUEST.path != 'auth')
+
+    @classmethod
+    def invalidate(cls, username=None):
+        """
+        Drop all cached pages for a user, or for all users.
+
+        :param username: The username to invalidate
+        :type  username: str
+        """
+        if username:
+            cls.cache().invalidate_tag(username)
+        else:
+            cls.cache().clear()
+
+    @staticmethod
+    def key():
+        """
+        Cache key for the current request, tagged by username. The embedded
+        user record is part of the key, so a page never outlives the cached
+        user record it was rendered from. Group records (including the active
+        group) are dictionaries, so they are folded into a repr to keep the
+        key hashable.
+        """
+        from lense.portal.ui.core.assets import AssetManifest
+        from lense.portal.ui.core.template import TemplateVersion
+        record = LENSE.PORTAL.USER.record
+        return (
+            LENSE.REQUEST.USER.name,
+            repr([getattr(record, k, None) for k in ['email', 'api_key', 'api_token', 'groups']]),
+            repr(LENSE.REQUEST.SESSION.get('active_group')),
+            LENSE.REQUEST.USER.admin,
+            LENSE.REQUEST.path,
+            LENSE.REQUEST.DJANGO.get_full_path(),
+            AssetManifest.load().get(LENSE.REQUEST.path, {}).get('version'),
+            TemplateVersion.get()
+        )
+
+    @classmethod
+    def get(cls):
+        """
+        Return the cached (content, etag) for the current request.
+        """
+        return cls.cache().get(cls.key())
+
+    @classmethod
+    def set(cls, content, etag):
+        """
+        Store a rendered page for the current request.
+
+        :param content: The page rendered with the CSRF placeholder
+        :type  content: str
+        :param    etag: The page entity tag
+        :type     etag: str
+        """
+        cls.cache().set(cls.key(), (content, etag))
+
+    @classmethod
+    def inject(cls, content):
+        """
+        Replace the CSRF placeholder with a token for the current session.
+
+        :param content: The cached page content
+        :type  content: str
+        """
+        from django.middleware.csrf import get_token
+        return content.replace(cls.CSRF, str(get_token(LENSE.REQUEST.DJANGO)))
@@ -1,14 +1,61 @@
 import sys
 import traceback
 
+# Django Libraries
+from django.http import HttpResponse, HttpResponseForbidden
+
 # Lense Libraries
 from lense.common.exceptions import EnsureError, AuthError, RequestError
+from lense.portal.ui.core.config import option
+from lense.portal.ui.core.timing import RequestTimer, PortalMetrics, timed
+
+def metrics(request):
+    """
+    Method used to serve request phase metrics to allowed clients.
+    """
+    if not request.META.get('REMOTE_ADDR') in option('portal.metrics.allow', ['127.0.0.1', '::1']):
+        return HttpResponseForbidden()
+    return HttpResponse(PortalMetrics.render(), content_type='text/plain; version=0.0.4')
+
+def labels():
+    """
+    Return the handler and view metric labels for the current request,
+    limited to known handlers and views.
+    """
+    portal = getattr(LENSE, 'PORTAL', None)
+    route  = None if not portal else portal.ROUTES.get(LENSE.REQUEST.path)
+    if not route:
+        return ('unknown', '')
+    return (route.name, LENSE.REQUEST.view if LENSE.REQUEST.view in getattr(route.controller, 'views', []) else '')
 
 def dispatch(request):
     """
     Method used to handle incoming portal requests.
     """
-    LENSE.SETUP.portal(request)
+    
+    # Internal metrics endpoint
+    if request.path == option('portal.metrics.path', '/_metrics'):
+        return metrics(request)
+    
+    # Time the request phases
+    timer = RequestTimer.start()
+    try:
+        response = _dispatch(request)
+    finally:
+        RequestTimer.stop()
+    
+    # Record metrics / expose phase timings
+    PortalMetrics.observe(*labels(), timer=timer)
+    if option('portal.metrics.server_timing', True):
+        response['Server-Timing'] = timer.header()
+    return response
+
+def _dispatch(request):
+    """
+    Set up the portal and run the request dispatcher.
+    """
+    with timed('setup'):
+        LENSE.SETUP.portal(request)
     
     # Run the request dispatcher
     try:
@@ -39,15 +86,25 @@ class RequestManager(object):
         Public method for running the portal request.
         """
         
+        # Look up the request path in the route table
+        route = LENSE.PORTAL.ROUTES.get(LENSE.REQUEST.path)
+        
         # If the path doesn't point to a valid handler
-        if not LENSE.REQUEST.path in LENSE.PORTAL.handlers:
+        if not route:
             return LENSE.HTTP.redirect('auth')
         
+        # Serve a cached rendered page
+        with timed('page_cache'):
+            response = LENSE.PORTAL.TEMPLATE.cached_response()
+        if response:
+            return response
+
         # Run the controller
-        LENSE.PORTAL.controller()
+        with timed('controller'):
+            LENSE.PORTAL.controller()
         
         # Load the application
-        return LENSE.PORTAL.handlers[LENSE.REQUEST.path].as_view()(LENSE.REQUEST.DJANGO)
+        return route.view.as_view()(LENSE.REQUEST.DJANGO)
     
     @classmethod
     def dispatch(cls, request):
@@ -0,0 +1,97 @@
+from threading import Lock
+from importlib import import_module
+from collections import Mapping, namedtuple
+
+# Portal route: handler view/controller classes, navigation and asset manifest
+PortalRoute = namedtuple('PortalRoute', ['name', 'view', 'controller', 'navigation', 'assets'])
+
+# Locations of the static assets and templates owned by a handler
+RouteAssets = namedtuple('RouteAssets', ['js', 'css', 'interface'])
+
+class FrozenMap(Mapping):
+    """
+    Read-only mapping wrapper.
+    """
+    def __init__(self, data):
+        self._data = dict(data)
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return '<{0}:{1}>'.format(self.__class__.__name__, sorted(self._data.keys()))
+
+class PortalRoutes(FrozenMap):
+    """
+    Process level route table mapping request paths to portal handlers. The
+    table is built once per process and shared by every request.
+    """
+
+    # Shared route table / build lock
+    _table = None
+    _lock  = Lock()
+
+    def __init__(self, routes):
+        super(PortalRoutes, self).__init__(routes)
+
+        # View / controller lookup tables
+        self.views       = FrozenMap([(k, v.view) for k,v in self._data.iteritems()])
+        self.controllers = FrozenMap([(k, v.controller) for k,v in self._data.iteritems()])
+
+    @staticmethod
+    def _navigation(module):
+        """
+        Return the navigation attributes for a handler module, if any.
+
+        :param module: The handler module path
+        :type  module: str
+        """
+        return getattr(getattr(import_module(module), 'HandlerNavigation', None), 'attrs', None)
+
+    @classmethod
+    def build(cls):
+        """
+        Discover handlers and construct a new route table.
+        """
+        views       = LENSE.MODULE.handlers(ext='views', load='HandlerView')
+        controllers = LENSE.MODULE.handlers(ext='controller', load='HandlerController')
+        modules     = dict([(h['name'], h['mod']) for h in LENSE.MODULE.handlers(ext='__init__')])
+        routes      = {}
+
+        # A route requires both a view and a controller
+        for name, view in views.iteritems():
+            if not name in controllers:
+                LENSE.LOG.error('<ROUTES> Handler "{0}" has no controller, skipping'.format(name))
+                continue
+
+            # Store the route
+            routes[name] = PortalRoute(
+                name       = name,
+                view       = view,
+                controller = controllers[name],
+                navigation = None if not name in modules else cls._navigation(modules[name]),
+                assets     = RouteAssets(
+                    js        = 'js/lense/handlers/{0}'.format(name),
+                    css       = 'css/{0}.css'.format(name),
+                    interface = 'handlers/{0}/interface.html'.format(name)
+                )
+            )
+        LENSE.LOG.info('<ROUTES> Constructed portal route table: {0}'.format(', '.join(sorted(routes.keys()))))
+        return cls(routes)
+
+    @classmethod
+    def load(cls):
+        """
+        Return the shared route table, building it on first use.
+        """
+        if cls._table is None:
+            with cls._lock:
+                if cls._table is None:
+                    cls._table = cls.build()
+        return cls._table
@@ -1,5 +1,5 @@
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
 
 # Django Libraries
 from django.conf import settings
@@ -9,19 +9,32 @@ from django.contrib import auth
 Session Timeouts
 """
 class SessionTimeout:
+  def _last_touch(self, request):
+    """
+    Return the last session touch as a UNIX timestamp.
+    """
+    last_touch = request.session.get('last_touch')
+
+    # Sessions written before timestamps were stored as integers
+    if isinstance(last_touch, datetime):
+        return int(time.mktime(last_touch.timetuple()))
+    return last_touch
+
   def process_request(self, request):
-    
+
     # Only attempt session timeout if user is logged in
     if not request.user.is_authenticated() :
       return
-  
+
+    # Current time / last touch
+    now        = int(time.time())
+    last_touch = self._last_touch(request)
+
     # Log the user out when the session expires
-    try:
-        
-        if datetime.now() - request.session['last_touch'] > timedelta(0, int(settings.SESSION_TIMEOUT) * 60, 0):
-            auth.logout(request)
-            del request.session['last_touch']
-            return
-    except KeyError:
-        pass
-    request.session['last_touch'] = datetime.now()
\ No newline at end of file
+    if last_touch and (now - last_touch) > (int(settings.SESSION_TIMEOUT) * 60):
+        auth.logout(request)
+        return
+
+    # Only persist the touch when the stored timestamp is older than the slack
+    if not last_touch or (now - last_touch) >= int(settings.SESSION_TOUCH_SLACK):
+        request.session['last_touch'] = now
@@ -1,9 +1,12 @@
 import os
 
+# Django Libraries
+from django.core.exceptions import ImproperlyConfigured
+
 # Lense Libraries
 from lense.common import config
 from lense.common.vars import TEMPLATES
-from lense.common.auth.utils import AuthGroupsLDAP
+from lense.portal.ui.core.directory import PortalLDAPSearch
 
 # Project configuration
 CONF             = config.parse('PORTAL')
@@ -14,6 +17,9 @@ BASE_DIR         = os.path.dirname(os.path.dirname(__file__))
 # Debug mode
 DEBUG            = True
 
+# Production mode
+PRODUCTION       = getattr(CONF.portal, 'production', False)
+
 # Hosts allowed to use the API
 ALLOWED_HOSTS    = []
 
@@ -36,6 +42,13 @@ ROOT_URLCONF     = 'lense.portal.ui.core.urls'
 # API WSGI application
 WSGI_APPLICATION = 'lense.portal.ui.core.wsgi.application'
 
+# Template loaders, compiled templates are cached in production mode
+LOADERS = [
+    'django.template.loaders.filesystem.Loader'
+]
+if PRODUCTION:
+    LOADERS = [('django.template.loaders.cached.Loader', LOADERS)]
+
 # Template directories
 TEMPLATES = [
     {
@@ -43,6 +56,7 @@ TEMPLATES = [
         'DIRS': [ TEMPLATES.PORTAL ],
         'APP_DIRS': False,
         'OPTIONS': {
+            'loaders': LOADERS,
             'context_processors': [
                 'django.contrib.auth.context_processors.auth',
                 'django.template.context_processors.debug',
@@ -56,6 +70,45 @@ TEMPLATES = [
     },
 ]
 
+# Shared cache backend: local (per process) or memcached (Unix socket, LRU bounded by memcached)
+CACHE_CONF       = getattr(CONF.portal, 'cache', None)
+CACHE_BACKEND    = getattr(CACHE_CONF, 'backend', 'local')
+CACHE_BACKENDS   = {
+    'local': ('django.core.cache.backends.locmem.LocMemCache', 'lense-portal-shared'),
+    'memcached': ('django.core.cache.backends.memcached.MemcachedCache', 'unix:/var/run/memcached/memcached.sock')
+}
+if not CACHE_BACKEND in CACHE_BACKENDS:
+    raise ImproperlyConfigured('Invalid portal.cache.backend "{0}", must be one of: {1}'.format(
+        CACHE_BACKEND, ', '.join(sorted(CACHE_BACKENDS.keys()))))
+
+# Caches, user independent template fragments are only cached in production mode
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'
+    },
+    'shared': {
+        'BACKEND': CACHE_BACKENDS[CACHE_BACKEND][0],
+        'LOCATION': getattr(CACHE_CONF, 'location', None) or CACHE_BACKENDS[CACHE_BACKEND][1]
+    },
+    'portal': {
+        'BACKEND': 'django.core.cache.backends.{0}'.format('locmem.LocMemCache' if PRODUCTION else 'dummy.DummyCache'),
+        'LOCATION': 'lense-portal'
+    },
+    'sessions': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': '/dev/shm/lense-portal-sessions',
+        'TIMEOUT': CONF.portal.timeout * 60
+    }
+}
+
+# Bound the number of entries kept by the in-process backend
+if CACHE_BACKEND != 'memcached':
+    CACHES['shared']['OPTIONS'] = {'MAX_ENTRIES': getattr(CACHE_CONF, 'max_entries', 4096)}
+
+# Share rendered fragments between processes
+if PRODUCTION and CACHE_BACKEND != 'local':
+    CACHES['portal'] = dict(CACHES['shared'], KEY_PREFIX='fragments')
+
 # Database connections
 DATABASES = {
     'default': {
@@ -99,8 +152,23 @@ AUTH_LDAP_SERVER_URI = 'ldap://{0}'.format(CONF.ldap.host)
 AUTH_LDAP_BIND_DN = CONF.ldap.user
 AUTH_LDAP_BIND_PASSWORD = CONF.ldap.password
         
-# LDAP user search
-AUTH_LDAP_USER_SEARCH = AuthGroupsLDAP.construct()
+# LDAP user search, constructed when the LDAP backend first uses it and cached
+def ldap_user_search():
+    from lense.common.auth.utils import AuthGroupsLDAP
+    return AuthGroupsLDAP.construct()
+AUTH_LDAP_USER_SEARCH = PortalLDAPSearch(ldap_user_search, getattr(CONF.ldap, 'map', None))
+
+# LDAP result caching / connection timeouts
+LDAP_CONF = getattr(CONF.portal, 'ldap', None)
+AUTH_LDAP_CACHE_TIMEOUT = getattr(LDAP_CONF, 'cache_ttl', 60)
+AUTH_LDAP_CACHE_GROUPS = True
+AUTH_LDAP_GROUP_CACHE_TIMEOUT = AUTH_LDAP_CACHE_TIMEOUT
+if CONF.ldap.host:
+    import ldap
+    AUTH_LDAP_CONNECTION_OPTIONS = {
+        ldap.OPT_NETWORK_TIMEOUT: getattr(LDAP_CONF, 'timeout', 5),
+        ldap.OPT_TIMEOUT: getattr(LDAP_CONF, 'timeout', 5)
+    }
 
 # Django middleware classes
 MIDDLEWARE_CLASSES = (
@@ -112,8 +180,22 @@ MIDDLEWARE_CLASSES = (
     'lense.portal.ui.core.session.SessionTimeout'
 )
 
-# Session serializer
-SESSION_SERIALIZER = 'django.contrib.sessions.serializers.PickleSerializer'
+# Session backends: engine / serializer
+SESSION_BACKENDS = {
+    'db': ('django.contrib.sessions.backends.db', 'django.contrib.sessions.serializers.PickleSerializer'),
+    'cached_db': ('django.contrib.sessions.backends.cached_db', 'django.contrib.sessions.serializers.JSONSerializer'),
+    'cache': ('django.contrib.sessions.backends.cache', 'django.contrib.sessions.serializers.JSONSerializer'),
+    'cookie': ('django.contrib.sessions.backends.signed_cookies', 'django.contrib.sessions.serializers.JSONSerializer')
+}
+
+# Session backend / serializer
+SESSION_ENGINE, SESSION_SERIALIZER = SESSION_BACKENDS[getattr(getattr(CONF.portal, 'session', None), 'backend', 'db')]
+
+# Cache backed sessions, shared between processes on the local host
+SESSION_CACHE_ALIAS = 'sessions'
 
 # Session timeout in minutes
 SESSION_TIMEOUT = CONF.portal.timeout
+
+# Only persist the session touch timestamp if older than this many seconds
+SESSION_TOUCH_SLACK = getattr(getattr(CONF.portal, 'session', None), 'touch_slack', 60)
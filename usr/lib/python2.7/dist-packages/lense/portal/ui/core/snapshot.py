@@ -0,0 +1,116 @@
+import json
+from hashlib import sha1
+from threading import Lock
+
+# Lense Libraries
+from lense.portal.ui.core.cache import create_cache
+from lense.portal.ui.core.config import option
+from lense.portal.ui.core.page import PortalPages
+
+class PortalSnapshot(object):
+    """
+    Process level snapshots of object collections embedded in the page for
+    the current view, so the client does not fetch lookup data over the
+    socket. Only the exported fields are embedded, the records a view
+    displays are still fetched in full. Each collection carries a version
+    stamp derived from its contents.
+    """
+
+    # Collections: name -> (LENSE.OBJECTS attribute, exported fields)
+    COLLECTIONS = {
+        'users': ('USER', ['uuid', 'username', 'first_name', 'last_name', 'email', 'from_ldap', 'groups']),
+        'groups': ('GROUP', ['uuid', 'name', 'desc', 'protected', 'members'])
+    }
+
+    # Shared snapshot cache
+    _cache = None
+    _lock  = Lock()
+
+    @classmethod
+    def cache(cls):
+        """
+        Return the shared snapshot cache.
+        """
+        if cls._cache is None:
+            with cls._lock:
+                if cls._cache is None:
+                    cls._cache = create_cache('snapshots',
+                        size = len(cls.COLLECTIONS),
+                        ttl  = option('portal.cache.snapshot_ttl', 30)
+                    )
+        return cls._cache
+
+    @classmethod
+    def invalidate(cls, name=None):
+        """
+        Drop a cached collection, or all collections.
+
+        :param name: The collection name
+        :type  name: str
+        """
+        if name:
+            cls.cache().delete(name)
+        else:
+            cls.cache().clear()
+
+        # Pages embedding the collections
+        PortalPages.invalidate()
+
+    @staticmethod
+    def _value(obj, key):
+        """
+        Read a field from an object or dictionary.
+        """
+        return obj.get(key) if isinstance(obj, dict) else getattr(obj, key, None)
+
+    @classmethod
+    def _load(cls, name):
+        """
+        Load and export a collection from the objects interface.
+        """
+        attr, fields = cls.COLLECTIONS[name]
+        objects      = getattr(LENSE.OBJECTS, attr, None)
+        if not objects:
+            return None
+
+        # Only the exported fields are ever embedded in the page
+        data = [dict([(k, cls._value(obj, k)) for k in fields]) for obj in (objects.get() or [])]
+        data = json.loads(json.dumps(data, default=str))
+        return {
+            'version': sha1(json.dumps(data, sort_keys=True)).hexdigest()[:12],
+            'data': data
+        }
+
+    @classmethod
+    def collection(cls, name):
+        """
+        Return a collection snapshot, loading it on a cache miss.
+
+        :param name: The collection name
+        :type  name: str
+        """
+        cache    = cls.cache()
+        snapshot = cache.get(name)
+        if snapshot is None:
+            with cls._lock:
+                snapshot = cache.get(name)
+                if snapshot is None:
+                    snapshot = cls._load(name)
+                    if snapshot:
+                        cache.set(name, snapshot)
+        return snapshot
+
+    @classmethod
+    def get(cls, names):
+        """
+        Return snapshots for a list of collections.
+
+        :param names: The collection names
+        :type  names: list
+        """
+        snapshots = {}
+        for name in names:
+            snapshot = cls.collection(name) if name in cls.COLLECTIONS else None
+            if snapshot:
+                snapshots[name] = snapshot
+        return snapshots
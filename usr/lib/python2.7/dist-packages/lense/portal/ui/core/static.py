@@ -0,0 +1,343 @@
+import os
+import re
+import posixpath
+import mimetypes
+from threading import Lock
+from collections import namedtuple
+
+# Django Libraries
+from django.utils.http import http_date, parse_http_date_safe
+
+# Lense Libraries
+from lense.common.vars import SHARE
+from lense.portal.ui.core.config import option, production
+from lense.portal.ui.core.cache import CacheGenerations
+
+# Fingerprinted file names written by the asset bundler: name.<sha1[:12]>.ext
+FINGERPRINT = re.compile(r'\.[0-9a-f]{12}\.[a-z0-9]+$')
+
+# Single byte range: bytes=start-end
+RANGE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+# Precompressed variants in order of preference: (encoding, extension)
+ENCODINGS = [('br', '.br'), ('gzip', '.gz')]
+
+# Read block size when no file wrapper is available or for byte ranges
+BLOCK_SIZE = 65536
+
+# Indexed static file / precompressed variant
+StaticFile = namedtuple('StaticFile', ['path', 'size', 'mtime', 'content_type', 'variants', 'immutable'])
+StaticVariant = namedtuple('StaticVariant', ['path', 'size', 'mtime'])
+
+class StaticIndex(object):
+    """
+    Index of the static tree built at startup, so requests for indexed files
+    never touch the filesystem except to open the file being served. Outside
+    of production, files written after the index was built are looked up and
+    indexed on a miss.
+    """
+    def __init__(self, root, resolve=False):
+        self.root    = root
+        self.real    = os.path.realpath(root)
+        self.resolve = resolve
+        self.files   = self.build(root)
+
+    @staticmethod
+    def _variant(name, names):
+        """
+        Check if a file is a precompressed variant of another file.
+        """
+        return bool([e for e in ENCODINGS if name.endswith(e[1]) and name[:-len(e[1])] in names])
+
+    @staticmethod
+    def _entry(filename, names):
+        """
+        Construct the index entry for a file.
+
+        :param filename: The file path
+        :type  filename: str
+        :param    names: The names of all files in the same directory
+        :type     names: set
+        """
+        name = os.path.basename(filename)
+        stat = os.stat(filename)
+
+        # Available precompressed variants
+        variants = {}
+        for encoding, ext in ENCODINGS:
+            if (name + ext) in names:
+                vstat = os.stat(filename + ext)
+                variants[encoding] = StaticVariant(filename + ext, vstat.st_size, int(vstat.st_mtime))
+
+        return StaticFile(
+            path         = filename,
+            size         = stat.st_size,
+            mtime        = int(stat.st_mtime),
+            content_type = mimetypes.guess_type(name)[0] or 'application/octet-stream',
+            variants     = variants,
+            immutable    = bool(FINGERPRINT.search(name))
+        )
+
+    @classmethod
+    def build(cls, root):
+        """
+        Walk the static tree and index every file by its relative URL path.
+
+        :param root: The static root directory
+        :type  root: str
+        """
+        files = {}
+        for path, dirs, names in os.walk(root):
+            names = set(names)
+            for name in names:
+
+                # Precompressed variants are served alongside their source
+                if cls._variant(name, names):
+                    continue
+
+                filename = os.path.join(path, name)
+                files[os.path.relpath(filename, root).replace(os.sep, '/')] = cls._entry(filename, names)
+        return files
+
+    def lookup(self, path):
+        """
+        Look up and index a file missing from the index, only resolving paths
+        inside the static root. Entries are only ever added under the
+        canonical relative path.
+
+        :param path: The relative URL path
+        :type  path: str
+        """
+        name = posixpath.normpath(path).lstrip('/')
+        if (name in ['', '.', '..']) or name.startswith('../'):
+            return None
+
+        # Alias of an indexed file, i.e. "./name" or "dir//name"
+        if name in self.files:
+            return self.files[name]
+
+        filename = os.path.realpath(os.path.join(self.root, name))
+        if not filename.startswith(self.real + os.sep) or not os.path.isfile(filename):
+            return None
+        try:
+            names = set(os.listdir(os.path.dirname(filename)))
+            if self._variant(os.path.basename(filename), names):
+                return None
+            entry = self._entry(filename, names)
+        except OSError:
+            return None
+        self.files[name] = entry
+        return entry
+
+    def get(self, path):
+        """
+        Look up a static file by its relative URL path.
+        """
+        entry = self.files.get(path)
+        if entry or not self.resolve:
+            return entry
+        return self.lookup(path)
+
+class StaticFiles(object):
+    """
+    WSGI middleware serving the portal static tree in front of the Django
+    application, for deployments without an Apache /static alias.
+    """
+    def __init__(self, application, root, prefix='/static/', max_age=3600):
+        self.application = application
+        self.root        = root
+        self.prefix      = prefix
+        self.max_age     = max_age
+
+        # Outside of production files may change after the index is built
+        self.verify      = not production()
+
+        # Static index / asset generation it was built for
+        self.index       = StaticIndex(root, resolve=self.verify)
+        self.generation  = CacheGenerations.get('assets')
+        self._lock       = Lock()
+
+        LENSE.LOG.info('<STATIC> Indexed {0} static files under: {1}'.format(len(self.index.files), root))
+
+    @classmethod
+    def wrap(cls, application):
+        """
+        Wrap the WSGI application if built-in static serving is enabled.
+
+        :param application: The Django WSGI application
+        :type  application: callable
+        """
+        if not option('portal.static.serve', False):
+            return application
+        return cls(application,
+            root    = '{0}/static'.format(SHARE.PORTAL),
+            prefix  = option('portal.static.prefix', '/static/'),
+            max_age = option('portal.static.max_age', 3600)
+        )
+
+    def __call__(self, environ, start_response):
+        path = environ.get('PATH_INFO', '')
+        if not path.startswith(self.prefix):
+            return self.application(environ, start_response)
+
+        # Rebuild the index when assets were invalidated, i.e. new bundles
+        generation = CacheGenerations.get('assets')
+        if generation != self.generation:
+            with self._lock:
+                if generation != self.generation:
+                    self.index      = StaticIndex(self.root, resolve=self.verify)
+                    self.generation = generation
+
+        # Only files inside the static root are ever served, new files are
+        # picked up by the rebuild in production and on a miss otherwise
+        entry = self.index.get(path[len(self.prefix):])
+        if not entry:
+            return self._status(start_response, '404 Not Found')
+        if not environ['REQUEST_METHOD'] in ['GET', 'HEAD']:
+            return self._status(start_response, '405 Method Not Allowed', [('Allow', 'GET, HEAD')])
+        return self.serve(environ, start_response, entry)
+
+    def _status(self, start_response, status, headers=[]):
+        """
+        Return an empty response with the given status.
+        """
+        start_response(status, [('Content-Length', '0')] + headers)
+        return []
+
+    def _encoding(self, environ, entry):
+        """
+        Select a precompressed variant accepted by the client.
+        """
+        if not entry.variants or environ.get('HTTP_RANGE'):
+            return None, None
+        accepted = {}
+        for token in environ.get('HTTP_ACCEPT_ENCODING', '').split(','):
+            params = [p.strip() for p in token.split(';')]
+            quality = [p[2:] for p in params[1:] if p.startswith('q=')]
+            try:
+                accepted[params[0].lower()] = float(quality[0]) if quality else 1.0
+            except ValueError:
+                continue
+        for encoding, ext in ENCODINGS:
+            if encoding in entry.variants and accepted.get(encoding, 0) > 0:
+                return encoding, entry.variants[encoding]
+        return None, None
+
+    def _range(self, environ, size, etag, mtime):
+        """
+        Parse a single byte range request, returning (start, end), None to
+        serve the full file, or False if the range cannot be satisfied.
+        """
+        header = environ.get('HTTP_RANGE')
+        if not header:
+            return None
+
+        # Only honour the range if the validator still matches
+        if_range = environ.get('HTTP_IF_RANGE')
+        if if_range and not if_range in [etag, http_date(mtime)]:
+            return None
+
+        match = RANGE.match(header.strip())
+        if not match or not (match.group(1) or match.group(2)):
+            return None
+        start, end = match.groups()
+
+        # Suffix range: last N bytes
+        if not start:
+            length = int(end)
+            if not length:
+                return False
+            return (max(0, size - length), size - 1)
+        start, end = int(start), (int(end) if end else size - 1)
+        if start >= size or end < start:
+            return False
+        return (start, min(end, size - 1))
+
+    def _not_modified(self, environ, etag, mtime):
+        """
+        Evaluate conditional request headers.
+        """
+        if_none_match = environ.get('HTTP_IF_NONE_MATCH')
+        if if_none_match:
+            tags = [t.strip() for t in if_none_match.split(',')]
+            return (etag in [t[2:] if t.startswith('W/') else t for t in tags]) or ('*' in tags)
+        since = parse_http_date_safe(environ.get('HTTP_IF_MODIFIED_SINCE', ''))
+        return bool(since) and (mtime <= since)
+
+    def _read(self, f, length):
+        """
+        Read a bounded number of bytes from an open file.
+        """
+        try:
+            while length > 0:
+                block = f.read(min(BLOCK_SIZE, length))
+                if not block:
+                    break
+                length -= len(block)
+                yield block
+        finally:
+            f.close()
+
+    def serve(self, environ, start_response, entry):
+        """
+        Serve an indexed static file.
+        """
+        encoding, variant = self._encoding(environ, entry)
+        source = variant or entry
+
+        # File removed since it was indexed, i.e. a cleaned up bundle
+        try:
+            f = open(source.path, 'rb')
+        except (IOError, OSError):
+            return self._status(start_response, '404 Not Found')
+
+        # Trust the index in production, otherwise use the open file
+        size, mtime = source.size, source.mtime
+        if self.verify:
+            stat = os.fstat(f.fileno())
+            size, mtime = stat.st_size, int(stat.st_mtime)
+
+        etag    = '"{0:x}-{1:x}{2}"'.format(mtime, size, '' if not encoding else '-{0}'.format(encoding))
+        headers = [
+            ('Content-Type', entry.content_type),
+            ('Last-Modified', http_date(mtime)),
+            ('ETag', etag),
+            ('Accept-Ranges', 'bytes'),
+            ('Cache-Control', 'public, max-age=31536000, immutable' if entry.immutable else 'public, max-age={0}'.format(self.max_age))
+        ]
+        if entry.variants:
+            headers.append(('Vary', 'Accept-Encoding'))
+        if encoding:
+            headers.append(('Content-Encoding', encoding))
+
+        # Client copy is current
+        if self._not_modified(environ, etag, mtime):
+            f.close()
+            start_response('304 Not Modified', headers)
+            return []
+
+        # Byte range
+        byterange = self._range(environ, size, etag, mtime)
+        if byterange is False:
+            f.close()
+            return self._status(start_response, '416 Requested Range Not Satisfiable', [('Content-Range', 'bytes */{0}'.format(size))])
+        if byterange:
+            start, end = byterange
+            headers.extend([('Content-Length', str(end - start + 1)), ('Content-Range', 'bytes {0}-{1}/{2}'.format(start, end, size))])
+            start_response('206 Partial Content', headers)
+            if environ['REQUEST_METHOD'] == 'HEAD':
+                f.close()
+                return []
+            f.seek(start)
+            return self._read(f, end - start + 1)
+
+        # Full file, zero-copy when the server provides a file wrapper
+        headers.append(('Content-Length', str(size)))
+        start_response('200 OK', headers)
+        if environ['REQUEST_METHOD'] == 'HEAD':
+            f.close()
+            return []
+        file_wrapper = environ.get('wsgi.file_wrapper')
+        if file_wrapper:
+            return file_wrapper(f, BLOCK_SIZE)
+        return self._read(f, size)
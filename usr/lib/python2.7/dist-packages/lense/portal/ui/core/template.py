@@ -1,12 +1,70 @@
+import os
+from time import time
 from sys import exc_info
+from hashlib import sha1
+from threading import Lock
 from traceback import extract_tb
 
 # Django Libraries
+from django.conf import settings
 from django.shortcuts import render
+from django.utils.safestring import mark_safe
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control, patch_vary_headers
 
 # Lense Libraries
-from lense import import_class
 from lense.portal import PortalBase
+from lense.portal.ui.core.config import option, production
+from lense.portal.ui.core.timing import timed
+from lense.portal.ui.core.encoder import script_dumps
+from lense.portal.ui.core.navigation import PortalNavigation
+from lense.portal.ui.core.snapshot import PortalSnapshot
+from lense.portal.ui.core.page import PortalPages
+
+class TemplateVersion(object):
+    """
+    Signature of the Django template directories, computed once per process
+    in production and at most every portal.assets.interval seconds otherwise.
+    """
+    _version = None
+    _checked = 0
+    _lock    = Lock()
+
+    @classmethod
+    def build(cls):
+        """
+        Hash the path and modification time of every template file.
+        """
+        stamps = []
+        for template in settings.TEMPLATES:
+            for root in template.get('DIRS', []):
+                for path, dirs, files in os.walk(root):
+                    for name in files:
+                        filename = os.path.join(path, name)
+                        stamps.append((filename, os.path.getmtime(filename)))
+        return sha1(repr(sorted(stamps))).hexdigest()[:12]
+
+    @classmethod
+    def _stale(cls, now):
+        """
+        Check if the template version should be rebuilt.
+        """
+        if cls._version is None:
+            return True
+        return (not production()) and (now - cls._checked > option('portal.assets.interval', 2))
+
+    @classmethod
+    def get(cls):
+        """
+        Return the template version.
+        """
+        now = time()
+        if cls._stale(now):
+            with cls._lock:
+                if cls._stale(now):
+                    cls._version = cls.build()
+                    cls._checked = now
+        return cls._version
 
 class PortalTemplate(PortalBase):
     """
@@ -14,12 +72,21 @@ class PortalTemplate(PortalBase):
     """
     def __init__(self):
 
-        # User defined template data / requesting user object
+        # User defined template data
         self.data    = {}
-        self.user    = LENSE.OBJECTS.USER.get(**{'username': LENSE.REQUEST.USER.name})
 
-        # Assets
-        self._assets = {}
+        # Assets / embedded collection snapshots
+        self._assets   = {}
+        self._snapshot = {}
+
+    @property
+    def user(self):
+        """
+        Return the requesting user object. Resolved on access, since the
+        template is created while the portal interface is being constructed
+        and before LENSE.PORTAL points at it.
+        """
+        return LENSE.PORTAL.USER.record
 
     def construct(self, title='Lense Portal', redirect=None):
         """
@@ -73,25 +140,11 @@ class PortalTemplate(PortalBase):
 
     def _navigation(self):
         """
-        Return a handler navigation if it exists.
+        Return the cached handler navigation and rendered menu visible to the
+        current user.
         """
-        nav = []
-
-        # Look for handler navigation
-        for handler in LENSE.MODULE.handlers(ext='__init__'):
-            try:
-                handler_nav = import_class('HandlerNavigation', handler['mod'], exit_on_fail=False)
-                LENSE.LOG.debug('Loading navigation for handler: {0}'.format(handler['name']))
-
-                # Store the handler navigation
-                nav.append(handler_nav.attrs)
-
-            # Handler has no navigation class
-            except Exception as e:
-                LENSE.LOG.exception('Failed to import handler navigation: {0}'.format(handler['name']))
-
-        # Return constructed navigation
-        return nav
+        with timed('navigation'):
+            return PortalNavigation.get(LENSE.REQUEST.USER.admin), PortalNavigation.render(LENSE.REQUEST.USER.admin)
 
     def _api_data(self):
         """
@@ -105,38 +158,63 @@ class PortalTemplate(PortalBase):
             'endpoint': '{0}://{1}:{2}'.format(LENSE.CONF.socket.proto, LENSE.CONF.socket.host, LENSE.CONF.socket.port)
         }
 
+    def _context(self, params):
+        """
+        Serialize the page context read by the client at bootstrap into a
+        single JSON document.
+
+        :param params: The base template parameters
+        :type  params: dict
+        """
+        with timed('context'):
+            return mark_safe(script_dumps({
+                'USER': params['USER'],
+                'REQUEST': params['REQUEST'],
+                'API': params['API'],
+                'ASSETS': {
+                    'handler': LENSE.PORTAL.ASSETS.handler,
+                    'version': self._assets.get('version')
+                },
+                'NAV': params['NAV'],
+                'SNAPSHOT': self._snapshot
+            }))
+
     def _merge_data(self, data={}):
         """
         Merge base template data and page specific template data.
         """
 
+        nav, nav_menu = self._navigation()
+
         # Base parameters
         params = {
             'USER': self._user_data(),
             'REQUEST': self._request_data(),
             'API': self._api_data(),
             'ASSETS': self._assets,
-            'NAV': self._navigation()
+            'NAV': nav,
+            'NAV_MENU': nav_menu
         }
+        params['CONTEXT'] = self._context(params)
 
         # Log base template data
-        self.log('Constructing base template data: USER={0}, REQUEST={1}, API={2}, ASSETS={3}'.format(
-            params['USER'],
-            params['REQUEST'],
-            params['API'],
-            params['ASSETS']
-        ), level='debug', method='_merge_data')
+        self.log('Constructing base template data', level='debug', method='_merge_data',
+            USER    = params['USER'],
+            REQUEST = params['REQUEST'],
+            API     = params['API'],
+            ASSETS  = params['ASSETS']
+        )
 
         # Merge extra template parameters
         for k,v in data.iteritems():
 
             # Do not overwrite the 'BASE' key
-            if k in ['USER','REQUEST','API', 'LENSE', 'ASSETS']:
+            if k in ['USER','REQUEST','API', 'LENSE', 'ASSETS', 'NAV', 'NAV_MENU', 'CONTEXT']:
                 raise RequestError('Template data key "{0}" cannot be overloaded'.format(k), code=500)
 
             # Append the template data key
             params[k] = v
-            self.log('Appending template data: key={0}, value={1}'.format(k,v), level='debug', method='_merge_data')
+            self.log('Appending template data', level='debug', method='_merge_data', key=k, value=v)
 
         # Return the template data object
         return params
@@ -146,7 +224,7 @@ class PortalTemplate(PortalBase):
         Generated include script.
         """
         if LENSE.REQUEST.path in exclude:
-            self.log('Skipping include: {0}, in_path={1}'.format(path, LENSE.REQUEST.path))
+            self.log('Skipping include', level='debug', method='_include_interface', include=path, in_path=LENSE.REQUEST.path)
             return ''
         return 'c.push(\'{0}\');'.format(path)
 
@@ -174,12 +252,84 @@ class PortalTemplate(PortalBase):
         """
 
         # Store assets
-        for k in ['js', 'css', 'templates']:
-            self._assets[k] = data.get(k, [])
+        for k in ['js', 'css', 'templates', 'common', 'bundle', 'version']:
+            self._assets[k] = data.get(k)
 
         # Construct includes script
         self._assets['INCLUDE'] = self._include_script()
 
+    def snapshot(self, names):
+        """
+        Embed collection snapshots used by the current view. Collections are
+        only embedded for administrators.
+
+        :param names: The collection names
+        :type  names: list
+        """
+        if names and LENSE.REQUEST.USER.admin:
+            with timed('snapshot'):
+                self._snapshot = PortalSnapshot.get(names)
+
+    @staticmethod
+    def etag(content):
+        """
+        Return the entity tag for a page rendered with the CSRF placeholder,
+        so the tag does not depend on the session which rendered it.
+
+        :param content: The rendered page content
+        :type  content: str
+        """
+        return '"{0}"'.format(sha1(content).hexdigest())
+
+    def _not_modified(self, etag):
+        """
+        Check if the client already holds the current page.
+
+        :param etag: The current entity tag
+        :type  etag: str
+        """
+        request = LENSE.REQUEST.DJANGO
+        if request.method not in ['GET', 'HEAD']:
+            return False
+        tags = [t.strip() for t in request.META.get('HTTP_IF_NONE_MATCH', '').split(',')]
+        return (etag in [t[2:] if t.startswith('W/') else t for t in tags]) or ('*' in tags)
+
+    def _cache_headers(self, response, etag):
+        """
+        Mark a page response as private to the user and revalidated on use.
+        """
+        response['ETag'] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ('Cookie',))
+        return response
+
+    def cached_response(self):
+        """
+        Return the cached rendered page for the current request, or None if
+        the page is not cached.
+        """
+        if not PortalPages.cacheable():
+            return None
+        page = PortalPages.get()
+        if not page:
+            return None
+        content, etag = page
+
+        # Client copy is current
+        if etag and self._not_modified(etag):
+            self.log('Not modified', level='debug', method='cached_response', etag=etag)
+            return self._cache_headers(HttpResponseNotModified(), etag)
+
+        self.log('Return cached page', level='debug', method='cached_response')
+        response = HttpResponse(PortalPages.inject(content))
+        return response if not etag else self._cache_headers(response, etag)
+
+    def _render(self):
+        """
+        Render the page with the CSRF placeholder in place of the token.
+        """
+        return render(LENSE.REQUEST.DJANGO, 'interface.html', dict(self.data, csrf_token=PortalPages.CSRF))
+
     def response(self):
         """
         Construct and return the template response.
@@ -187,13 +337,28 @@ class PortalTemplate(PortalBase):
 
         # If redirecting
         if 'redirect' in self.data:
-            self.log('Redirecting -> {0}'.format(self.data['redirect']), level='debug', method='response')
+            self.log('Redirecting', level='debug', method='response', redirect=self.data['redirect'])
             return LENSE.HTTP.redirect(self.data['redirect'])
 
         # Return the template response
         try:
-            self.log('Return response: interface.html, data={0}'.format(self.data), level='debug', method='response')
-            return render(LENSE.REQUEST.DJANGO, 'interface.html', self.data)
+            self.log('Return response: interface.html', level='debug', method='response', data=self.data)
+            with timed('render'):
+                response = self._render()
+            etag = None if not option('portal.etag', True) else self.etag(response.content)
+
+            # Embedded snapshots change through the API, out of reach of page invalidation
+            if PortalPages.cacheable() and not self._snapshot:
+                PortalPages.set(response.content, etag)
+
+            # Client copy is current
+            if etag and self._not_modified(etag):
+                self.log('Not modified', level='debug', method='response', etag=etag)
+                return self._cache_headers(HttpResponseNotModified(), etag)
+
+            # Inject the token for the requesting session
+            response.content = PortalPages.inject(response.content)
+            return response if not etag else self._cache_headers(response, etag)
 
         # Failed to render template
         except Exception as e:
@@ -0,0 +1,135 @@
+from time import time
+from bisect import bisect_left
+from threading import Lock, local
+from contextlib import contextmanager
+
+# Histogram bucket upper bounds in seconds
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Active request timers per thread
+_active = local()
+
+class RequestTimer(object):
+    """
+    Collect the duration of each phase of a portal request.
+    """
+    def __init__(self):
+        self.started = time()
+
+        # Completed phases: (name, seconds)
+        self.phases  = []
+
+    @classmethod
+    def start(cls):
+        """
+        Start a timer for the current request thread.
+        """
+        _active.timer = cls()
+        return _active.timer
+
+    @classmethod
+    def current(cls):
+        """
+        Return the timer for the current request thread, if any.
+        """
+        return getattr(_active, 'timer', None)
+
+    @classmethod
+    def stop(cls):
+        """
+        Stop and return the timer for the current request thread.
+        """
+        timer = cls.current()
+        _active.timer = None
+        if timer:
+            timer.phases.append(('total', time() - timer.started))
+        return timer
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Time a request phase.
+
+        :param name: The phase name
+        :type  name: str
+        """
+        started = time()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time() - started))
+
+    def header(self):
+        """
+        Return the phase durations as a Server-Timing header value.
+        """
+        return ', '.join(['{0};dur={1:.2f}'.format(n, s * 1000) for n,s in self.phases])
+
+@contextmanager
+def timed(name):
+    """
+    Time a phase of the current request, if the request is being timed.
+
+    :param name: The phase name
+    :type  name: str
+    """
+    timer = RequestTimer.current()
+    if not timer:
+        yield
+    else:
+        with timer.phase(name):
+            yield
+
+class PortalMetrics(object):
+    """
+    Process level request phase histograms per handler and view.
+    """
+
+    # Histograms: (handler, view, phase) -> [bucket counts, sum, count]
+    _histograms = {}
+    _lock       = Lock()
+
+    # Metric name
+    name        = 'lense_portal_request_phase_seconds'
+
+    @classmethod
+    def observe(cls, handler, view, timer):
+        """
+        Record the phase durations of a completed request.
+
+        :param handler: The request handler
+        :type  handler: str
+        :param    view: The request view
+        :type     view: str
+        :param   timer: The completed request timer
+        :type    timer: RequestTimer
+        """
+        with cls._lock:
+            for phase, seconds in timer.phases:
+                histogram = cls._histograms.setdefault((handler, view, phase), [[0] * len(BUCKETS), 0.0, 0])
+                index = bisect_left(BUCKETS, seconds)
+                if index < len(BUCKETS):
+                    histogram[0][index] += 1
+                histogram[1] += seconds
+                histogram[2] += 1
+
+    @classmethod
+    def render(cls):
+        """
+        Return all histograms in the Prometheus text exposition format.
+        """
+        lines = [
+            '# HELP {0} Duration of portal request phases'.format(cls.name),
+            '# TYPE {0} histogram'.format(cls.name)
+        ]
+        with cls._lock:
+            for (handler, view, phase), (buckets, total, count) in sorted(cls._histograms.iteritems()):
+                labels     = 'handler="{0}",view="{1}",phase="{2}"'.format(handler, view, phase)
+                cumulative = 0
+                for bound, bucket in zip(BUCKETS, buckets):
+                    cumulative += bucket
+                    lines.append('{0}_bucket{{{1},le="{2}"}} {3}'.format(cls.name, labels, bound, cumulative))
+                lines.append('{0}_bucket{{{1},le="+Inf"}} {2}'.format(cls.name, labels, count))
+                lines.append('{0}_sum{{{1}}} {2}'.format(cls.name, labels, total))
+                lines.append('{0}_count{{{1}}} {2}'.format(cls.name, labels, count))
+        return '\n'.join(lines) + '\n'
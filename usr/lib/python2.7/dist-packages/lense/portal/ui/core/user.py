@@ -0,0 +1,104 @@
+from threading import Lock
+
+# Lense Libraries
+from lense.portal.ui.core.cache import create_cache
+from lense.portal.ui.core.config import option
+from lense.portal.ui.core.page import PortalPages
+
+class PortalUserRecord(object):
+    """
+    Snapshot of a user object and its resolved groups.
+    """
+    def __init__(self, user):
+        self.username  = getattr(user, 'username', None)
+        self.email     = getattr(user, 'email', None)
+        self.api_key   = getattr(user, 'api_key', None)
+        self.api_token = getattr(user, 'api_token', None)
+        self.groups    = list(getattr(user, 'groups', None) or [])
+
+    def __repr__(self):
+        return '<{0}:{1}>'.format(self.__class__.__name__, self.username)
+
+class PortalUser(object):
+    """
+    Request scoped user context. The user and its groups are loaded at most
+    once per request, from a process level cache keyed by username and
+    session.
+    """
+
+    # Shared user cache
+    _cache = None
+    _lock  = Lock()
+
+    def __init__(self):
+        self.name       = LENSE.REQUEST.USER.name
+        self.authorized = LENSE.REQUEST.USER.authorized
+
+        # Loaded user record
+        self._record    = None
+
+    @classmethod
+    def cache(cls):
+        """
+        Return the shared user cache.
+        """
+        if cls._cache is None:
+            with cls._lock:
+                if cls._cache is None:
+                    cls._cache = create_cache('users',
+                        size = option('portal.cache.user_size', 1024),
+                        ttl  = option('portal.cache.user_ttl', 30)
+                    )
+        return cls._cache
+
+    @classmethod
+    def invalidate(cls, username):
+        """
+        Drop all cached records and rendered pages for a user.
+
+        :param username: The username to invalidate
+        :type  username: str
+        """
+        cls.cache().invalidate_tag(username)
+        PortalPages.invalidate(username)
+
+    @property
+    def key(self):
+        """
+        Cache key for the current user and session.
+        """
+        return (self.name, getattr(LENSE.REQUEST.DJANGO.session, 'session_key', None))
+
+    @property
+    def record(self):
+        """
+        Return the user record, loading it on first access.
+        """
+        if (self._record is None) and self.authorized:
+            cache        = self.cache()
+            self._record = cache.get(self.key)
+
+            # Cache miss, load from the database
+            if self._record is None:
+                self._record = PortalUserRecord(LENSE.OBJECTS.USER.get(username=self.name))
+                cache.set(self.key, self._record)
+        return self._record
+
+    @property
+    def groups(self):
+        """
+        Return the groups for the current user.
+        """
+        return [] if not self.record else self.record.groups
+
+    def is_member(self, group):
+        """
+        Check if the current user is a member of a group.
+
+        :param group: The group UUID
+        :type  group: str
+        """
+        for usr_group in self.groups:
+            if usr_group['uuid'] == group:
+                return True
+        return False
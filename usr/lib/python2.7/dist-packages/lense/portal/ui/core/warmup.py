@@ -0,0 +1,142 @@
+import os
+from time import time
+from threading import Lock
+from contextlib import contextmanager
+
+# Lense Libraries
+from lense.portal.ui.core.log import PortalLog
+from lense.portal.ui.core.config import option, production
+
+class PortalWarmup(object):
+    """
+    Process level warm-up, preloading everything the first request would
+    otherwise construct and recording how long each phase took. Phases are
+    independent, a failing phase is logged and does not stop the others.
+    """
+
+    # Phase timings: (name, seconds, error)
+    timings = []
+    _done   = False
+    _lock   = Lock()
+
+    @classmethod
+    def log(cls, msg, level='info', **fields):
+        """
+        Write a warm-up log message.
+        """
+        PortalLog.write(level, '<WARMUP>', msg, **fields)
+
+    @classmethod
+    @contextmanager
+    def timed(cls, name, ignore=False):
+        """
+        Time a warm-up or import phase, recording any error raised.
+
+        :param   name: The phase name
+        :type    name: str
+        :param ignore: Record errors instead of raising them
+        :type  ignore: bool
+        """
+        started = time()
+        try:
+            yield
+        except Exception as e:
+            cls.timings.append((name, time() - started, '{0}: {1}'.format(type(e).__name__, e)))
+            if not ignore:
+                raise
+        else:
+            cls.timings.append((name, time() - started, None))
+
+    @staticmethod
+    def _routes():
+        """
+        Build the portal route table.
+        """
+        from lense.portal.ui.core.routes import PortalRoutes
+        PortalRoutes.load()
+
+    @staticmethod
+    def _assets():
+        """
+        Build the asset manifest for every handler.
+        """
+        from lense.portal.ui.core.assets import AssetManifest
+        AssetManifest.load()
+
+    @staticmethod
+    def _navigation():
+        """
+        Build and render the navigation for each permission set.
+        """
+        from lense.portal.ui.core.navigation import PortalNavigation
+        for admin in [False, True]:
+            PortalNavigation.render(admin)
+
+    @staticmethod
+    def _templates():
+        """
+        Load and compile every Django template into the cached template
+        loader, which is only enabled in production mode.
+        """
+        from django.conf import settings
+        from django.template.loader import get_template
+        for template in settings.TEMPLATES:
+            for root in template.get('DIRS', []):
+                for path, dirs, files in os.walk(root):
+                    for name in files:
+                        if name.endswith('.html'):
+                            get_template(os.path.relpath(os.path.join(path, name), root))
+
+    @staticmethod
+    def _ldap():
+        """
+        Construct the LDAP user search, which is otherwise deferred until
+        the LDAP backend is first used.
+        """
+        from django.conf import settings
+        settings.AUTH_LDAP_USER_SEARCH.search()
+
+    @classmethod
+    def phases(cls, ldap=None):
+        """
+        Return the enabled warm-up phases.
+
+        :param ldap: Construct the LDAP user search, defaults to the
+                     portal.warmup.ldap option
+        :type  ldap: bool
+        """
+        phases = [
+            ('routes', cls._routes),
+            ('assets', cls._assets),
+            ('navigation', cls._navigation)
+        ]
+        if production():
+            phases.append(('templates', cls._templates))
+        if option('portal.warmup.ldap', False) if ldap is None else ldap:
+            phases.append(('ldap', cls._ldap))
+        return phases
+
+    @classmethod
+    def run(cls, force=False, ldap=None):
+        """
+        Run the warm-up phases once per process and log the timings.
+
+        :param force: Run the warm-up again even if it has already run
+        :type  force: bool
+        :param  ldap: Construct the LDAP user search
+        :type   ldap: bool
+        """
+        with cls._lock:
+            if cls._done and not force:
+                return cls.timings
+            for name, method in cls.phases(ldap):
+                with cls.timed(name, ignore=True):
+                    method()
+            cls._done = True
+
+        # Report phase timings and failures
+        for name, seconds, error in cls.timings:
+            if error:
+                cls.log('Phase failed', level='warning', phase=name, error=error)
+        cls.log('Process warm-up complete', **dict([(n, '{0:.1f}ms'.format(s * 1000)) for n,s,e in cls.timings]))
+        return cls.timings
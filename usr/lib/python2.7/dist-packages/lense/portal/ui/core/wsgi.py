@@ -1,12 +1,22 @@
 import os
 from lense.common import init_project
+from lense.portal.ui.core.warmup import PortalWarmup
 
 # Load Django settings
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "lense.portal.ui.core.settings")
 
 # Initialize the project
-init_project('PORTAL')
+with PortalWarmup.timed('init_project'):
+    init_project('PORTAL')
 
 # Start the API WSGI application
-from django.core.wsgi import get_wsgi_application
-application = get_wsgi_application()
\ No newline at end of file
+with PortalWarmup.timed('django'):
+    from django.core.wsgi import get_wsgi_application
+    from lense.portal.ui.core.static import StaticFiles
+    application = StaticFiles.wrap(get_wsgi_application())
+
+# Preload the route table, assets and templates, the script is imported at
+# daemon process start by the Apache site configuration
+from lense.portal.ui.core.config import option
+if option('portal.warmup.enabled', True):
+    PortalWarmup.run()
@@ -1,14 +1,18 @@
 from django.views.generic import View
 
+# Lense Libraries
+from lense.portal.ui.core.log import PortalLog
+
 class BaseHandlerController(View):
     """
     Base handler controller.
     """
-    def __init__(self, views=[], default=None):
+    def __init__(self, views=[], default=None, snapshots={}):
     
-        # Handler views / default page
-        self.views   = views
-        self.default = default if default else LENSE.PORTAL.ASSETS.handler
+        # Handler views / default page / collections embedded per view
+        self.views     = views
+        self.default   = default if default else LENSE.PORTAL.ASSETS.handler
+        self.snapshots = snapshots
     
         # Bootstrap the handler
         self._bootstrap()
@@ -18,31 +22,28 @@ class BaseHandlerController(View):
         Bootstrap the requested handler.
         """
         LENSE.PORTAL.TEMPLATE.include(LENSE.PORTAL.ASSETS.construct())
+        LENSE.PORTAL.TEMPLATE.snapshot(self.snapshots.get(LENSE.REQUEST.view, []))
     
-    def log(self, msg, level='info'):
+    def log(self, msg, level='info', **fields):
         """
         Log wrapper per handler.
         """
-        logger = getattr(LENSE.LOG, level, 'info')
-        logger('<CONTROLLER:{0}:{1}.{2}> {3}'.format(
+        PortalLog.write(level, lambda: '<CONTROLLER:{0}:{1}.{2}>'.format(
             self.__class__.__name__,
             LENSE.REQUEST.method.upper(),
-            LENSE.REQUEST.path, 
-            msg
-        ))
+            LENSE.REQUEST.path
+        ), msg, **fields)
 
 class BaseHandlerView(View):
     """
     Base handler view.
     """
-    def log(self, msg, level='info'):
+    def log(self, msg, level='info', **fields):
         """
         Log wrapper per handler.
         """
-        logger = getattr(LENSE.LOG, level, 'info')
-        logger('<VIEW:{0}:{1}.{2}> {3}'.format(
+        PortalLog.write(level, lambda: '<VIEW:{0}:{1}.{2}>'.format(
             self.__class__.__name__,
             LENSE.REQUEST.method.upper(),
-            LENSE.REQUEST.path, 
-            msg
-        ))
\ No newline at end of file
+            LENSE.REQUEST.path
+        ), msg, **fields)
\ No newline at end of file
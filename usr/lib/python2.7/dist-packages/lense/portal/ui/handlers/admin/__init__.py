@@ -1,5 +1,6 @@
 class HandlerNavigation(object):
     attrs = {
+        'admin': True,
         'parent': {
             'name': 'Administration'
         },
@@ -4,16 +4,23 @@ class HandlerController(BaseHandlerController):
     """
     Portal formula application controller class.
     """
-    views   = ['users', 'groups', 'models', 'handlers']
-    default = 'admin?view=users'
+    views     = ['users', 'groups', 'models', 'handlers']
+    default   = 'admin?view=users'
+    
+    # Collections embedded in the page per view
+    snapshots = {
+        'users': ['users', 'groups'],
+        'groups': ['groups', 'users']
+    }
     
     def __init__(self):
         LENSE.PORTAL.ASSETS.handler = 'admin'
         
         # Load the base handler
         super(HandlerController, self).__init__(
-            views   = self.views,
-            default = self.default
+            views     = self.views,
+            default   = self.default,
+            snapshots = self.snapshots
         )
     
     def construct(self, **kwargs):
@@ -1,8 +1,10 @@
 # Django Libraries
-
+from django.conf import settings
 
 # Lense Libraries
 from lense.common.exceptions import AuthError
+from lense.portal.ui.core.user import PortalUser
+from lense.portal.ui.core.timing import timed
 from lense.portal.ui.handlers import BaseHandlerView
 
 class HandlerView(BaseHandlerView):
@@ -40,6 +42,7 @@ class HandlerView(BaseHandlerView):
 
         # Logout the user
         if action == 'logout':
+            PortalUser.invalidate(LENSE.REQUEST.USER.name)
             LENSE.OBJECTS.USER.logout()
             return LENSE.HTTP.redirect('auth')
         
@@ -48,10 +51,13 @@ class HandlerView(BaseHandlerView):
             try:
             
                 # Log the user in
-                return LENSE.OBJECTS.USER.login(LENSE.REQUEST.POST('username'), LENSE.REQUEST.POST('password'))
+                PortalUser.invalidate(LENSE.REQUEST.POST('username'))
+                with timed('login'):
+                    return LENSE.OBJECTS.USER.login(LENSE.REQUEST.POST('username'), LENSE.REQUEST.POST('password'))
             
-            # Authentication error
+            # Authentication error, look the user up again on the next attempt
             except AuthError as e:
+                settings.AUTH_LDAP_USER_SEARCH.invalidate(LENSE.REQUEST.POST('username'))
                 return LENSE.HTTP.redirect('auth', 'error={0}'.format(str(e)))
     
     def get(self, request, *args, **kwargs):
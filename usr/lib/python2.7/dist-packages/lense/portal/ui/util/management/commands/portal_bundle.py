@@ -0,0 +1,39 @@
+# Django Libraries
+from django.core.management.base import BaseCommand, CommandError
+
+# Lense Libraries
+from lense.common import init_project
+from lense.portal.ui.core.config import option
+
+class Command(BaseCommand):
+    """
+    Build fingerprinted JavaScript/CSS bundles for each portal handler.
+    """
+    help = 'Build fingerprinted and precompressed JavaScript/CSS bundles for each portal handler'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--no-minify', action='store_false', dest='minify', default=True,
+            help='Concatenate assets without minifying them')
+        parser.add_argument('--no-compress', action='store_false', dest='compress', default=True,
+            help='Do not write .gz/.br precompressed variants')
+
+    def handle(self, *args, **options):
+        init_project('PORTAL')
+        from lense.portal.ui.core.bundle import AssetBundler
+        from lense.portal.ui.core.assets import AssetManifest
+        from lense.portal.ui.core.cache import CacheGenerations
+
+        # Running portal processes could not be told about the new bundles
+        if not CacheGenerations.shared():
+            raise CommandError('Failed to map cache generations "{0}", see the portal log'.format(
+                option('portal.cache.generations', '/dev/shm/lense-portal-cache.gen')))
+
+        # Build the bundles
+        manifest = AssetBundler(minify=options['minify'], compress=options['compress']).build()
+
+        # Running portal processes pick up the new bundles
+        AssetManifest.invalidate()
+
+        # Show the bundle manifest
+        for name, bundle in sorted(manifest['handlers'].iteritems()):
+            self.stdout.write('{0}: {1}, {2}'.format(name, bundle['js'], bundle['css']))
@@ -0,0 +1,31 @@
+# Django Libraries
+from django.core.management.base import BaseCommand, CommandError
+
+# Lense Libraries
+from lense.common import init_project
+
+class Command(BaseCommand):
+    """
+    Run the portal process warm-up and report phase timings.
+    """
+    help = 'Preload the route table, asset manifest, navigation and templates and report timings'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--ldap', action='store_true', dest='ldap', default=None,
+            help='Also construct the LDAP user search')
+
+    def handle(self, *args, **options):
+        from lense.portal.ui.core.warmup import PortalWarmup
+        with PortalWarmup.timed('init_project'):
+            init_project('PORTAL')
+
+        # Run the warm-up phases
+        timings = PortalWarmup.run(ldap=options['ldap'])
+
+        # Show phase timings
+        failed = False
+        for name, seconds, error in timings:
+            failed = failed or bool(error)
+            self.stdout.write('{0:<14} {1:>9.1f}ms {2}'.format(name, seconds * 1000, error or 'ok'))
+        if failed:
+            raise CommandError('Portal warm-up failed')
@@ -1,8 +1,9 @@
-import json
-
 # Django Libraries
 from django import template
-from django.utils import six
+from django.utils.safestring import mark_safe
+
+# Lense Libraries
+from lense.portal.ui.core.encoder import script_dumps
 
 # Register template tag library
 register = template.Library()
@@ -10,25 +11,7 @@ register = template.Library()
 @register.simple_tag
 def py2js(obj):
     """
-    Convert a Python object to a JavaScript value to render on page.
+    Convert a Python object to a JavaScript value to render on page. Values
+    are JSON encoded and escaped for use inside a script element.
     """
-    
-    # Undefined
-    if obj == None:
-        return 'null'
-    
-    # Boolean values
-    if isinstance(obj, bool):
-        return 'true' if obj else 'false'
-    
-    # Integer values
-    if isinstance(obj, six.integer_types):
-        return obj
-    
-    # String values
-    if isinstance(obj, six.string_types):
-        return '"{0}"'.format(obj)
-    
-    # List / dictionary values
-    if isinstance(obj, (list, dict)):
-        return json.dumps(obj)
\ No newline at end of file
+    return mark_safe(script_dumps(obj))
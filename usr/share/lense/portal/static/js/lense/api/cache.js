@@ -5,18 +5,79 @@ lense.import('api.cache', function() {
 	this.users    = null;
 	this.groups   = null;
 
+	// Collection versions
+	this.versions = {};
+
+	// Collection lifetime in seconds
+	this.ttl      = 300;
+
+	// Collection request handlers
+	this.handlers = {
+		user_get: 'users',
+		group_get: 'groups'
+	};
+
+	// Handler prefixes which modify a collection
+	this.modifiers = {
+		user_: 'users',
+		group_: 'groups'
+	};
+
+	// Object types pushed by the socket server
+	this.types = {
+		user: 'users',
+		group: 'groups'
+	};
+
 	/**
 	 * Cached Data Interface
 	 *
 	 * @param {String} type The object type
 	 * @param {Object} data The object data
+	 * @param {Integer} ttl The lifetime in seconds
 	 */
-	function CachedDataInterface(type, data) {
-		var inner  = this;
+	function CachedDataInterface(type, data, ttl) {
+		var inner     = this;
 
-		// Object type / data
-		inner.type = type;
-		inner.data = data;
+		// Object type / data / expiry
+		inner.type    = type;
+		inner.data    = data;
+		inner.expires = Date.now() + (ttl * 1000);
+
+		// Lookup indexes by key
+		inner.indexes = {};
+
+		/**
+		 * Index Objects
+		 *
+		 * Build or return the hash index for a key, later objects taking
+		 * precedence over earlier ones with the same value.
+		 *
+		 * @param {String} key The key to index on
+		 */
+		inner.index = function(key) {
+			if (!inner.indexes.hasOwnProperty(key)) {
+				var index = Object.create(null);
+				$.each(inner.data, function(i,obj) {
+					if (obj !== null && obj.hasOwnProperty(key)) {
+						index[obj[key]] = obj;
+					}
+				});
+				inner.indexes[key] = index;
+			}
+			return inner.indexes[key];
+		}
+
+		/**
+		 * Find Object
+		 *
+		 * @param {String} key The key string to look up
+		 * @param {String} value The key value to look for
+		 */
+		inner.find = function(key, value) {
+			var obj = inner.index(key)[value];
+			return (obj === undefined) ? null: obj;
+		}
 
 		/**
 		 * Map Object
@@ -26,13 +87,143 @@ lense.import('api.cache', function() {
 		 * @param {String} attr The mapped attribute value to return
 		 */
 		inner.map = function(key, value, attr) {
-			var retval = null;
-			$.each(inner.data, function(i,obj) {
-				if (hasattr(obj, key) && obj[key] == value) {
-					retval = getattr(obj, attr, null);
-				}
-			});
-			return retval;
+			return getattr(inner.find(key, value), attr, null);
+		}
+
+		/**
+		 * Check Expiry
+		 */
+		inner.expired = function() {
+			return Date.now() > inner.expires;
+		}
+	}
+
+	/**
+	 * Initialize APICache
+	 * @constructor
+	 */
+	this.__init__ = function() {
+
+		// Load collections embedded in the page context
+		self.load(getattr(lense.context, 'SNAPSHOT', {}));
+	}
+
+	/**
+	 * Load Snapshots
+	 *
+	 * Store embedded collection snapshots, skipping any collection modified
+	 * by this session since the server rendered that version.
+	 *
+	 * @param {Object} snapshots Collection snapshots keyed by name
+	 */
+	this.load = function(snapshots) {
+		$.each(snapshots, function(name, snapshot) {
+			var stale = sessionStorage.getItem('lense.cache.stale.' + name);
+
+			// Version is unchanged / modified since
+			if (self.versions[name] === snapshot.version || stale === snapshot.version) {
+				return true;
+			}
+			sessionStorage.removeItem('lense.cache.stale.' + name);
+
+			// Store the collection
+			self.versions[name] = snapshot.version;
+			self[name] = new CachedDataInterface(name, snapshot.data, self.ttl);
+		});
+	}
+
+	/**
+	 * Get Collection
+	 *
+	 * @param {String} name The collection name
+	 * @returns {CachedDataInterface} The collection, or null if missing or expired
+	 */
+	this.get = function(name) {
+		var collection = getattr(self, name, null);
+		if (collection !== null && collection.expired()) {
+			self[name] = null;
+			delete self.versions[name];
+			return null;
+		}
+		return collection;
+	}
+
+	/**
+	 * Drop Collection
+	 *
+	 * Drop a collection and flag its version as stale until the server
+	 * renders a new one.
+	 *
+	 * @param {String} name The collection name
+	 */
+	this.drop = function(name) {
+		if (hasattr(self.versions, name)) {
+			sessionStorage.setItem('lense.cache.stale.' + name, self.versions[name]);
+			delete self.versions[name];
+		}
+		self[name] = null;
+	}
+
+	/**
+	 * Invalidate Object Type
+	 *
+	 * Drop the collection for an object type changed on the server.
+	 *
+	 * @param {String} type The object type
+	 */
+	this.invalidate = function(type) {
+		var name = getattr(self.types, type, null);
+		if (name !== null) {
+			self.drop(name);
+		}
+	}
+
+	/**
+	 * Expire Collection
+	 *
+	 * Drop a collection modified by a request handler.
+	 *
+	 * @param {String} handler The request handler
+	 */
+	this.expire = function(handler) {
+		if (hasattr(self.handlers, handler)) {
+			return false;
+		}
+		$.each(self.modifiers, function(prefix, name) {
+			if (handler.indexOf(prefix) === 0) {
+				self.drop(name);
+			}
+		});
+	}
+
+	/**
+	 * Submit Request
+	 *
+	 * Answer a full collection lookup from the cache if possible, otherwise
+	 * submit it to the API. Snapshots only carry the exported fields, so
+	 * this is only used for lookup data, never for the records a view
+	 * displays.
+	 *
+	 * @param {String} handler The handler ID to submit the request to
+	 * @param {Object} data Any additional request data
+	 * @param {String} callback The response callback
+	 */
+	this.submit = function(handler, data, callback) {
+		var name   = getattr(self.handlers, handler, null);
+		var cached = (name !== null && !defined(data)) ? self.get(name): null;
+
+		// Not cached
+		if (cached === null) {
+			return lense.api.request.submit(handler, data, callback);
+		}
+
+		// Callback uses a key argument
+		var response = $.extend(true, [], cached.data);
+		if (callback.contains('+')) {
+			var attrs = callback.split('+');
+			lense.callback[attrs[0]](attrs[1], response);
+		} else {
+			lense.callback[callback](response);
 		}
 	}
 
@@ -40,14 +231,14 @@ lense.import('api.cache', function() {
 	 * Callback for users data
 	 */
 	lense.register.callback('cachedUsers', function(data) {
-		self.users = new CachedDataInterface('users', data);
+		self.users = new CachedDataInterface('users', data, self.ttl);
 	});
 
 	/**
 	 * Callback for groups data
 	 */
 	lense.register.callback('cachedGroups', function(data) {
-		self.users = new CachedDataInterface('groups', data);
+		self.groups = new CachedDataInterface('groups', data, self.ttl);
 	});
 
 	/**
@@ -55,8 +246,12 @@ lense.import('api.cache', function() {
 	 */
 	this.construct = function() {
 
-		// Retrieve users and groups
-		lense.api.request.submit('user_get', null, 'cachedUsers');
-		lense.api.request.submit('group_get', null, 'cachedGroups');
+		// Retrieve users and groups not embedded in the page
+		if (self.get('users') === null) {
+			lense.api.request.submit('user_get', null, 'cachedUsers');
+		}
+		if (self.get('groups') === null) {
+			lense.api.request.submit('group_get', null, 'cachedGroups');
+		}
 	}
 });
@@ -7,6 +7,9 @@ lense.import('api.client', function() {
 	// Cookie keys
 	this.cookies = ['user', 'group', 'key', 'token', 'endpoint', 'session'];
 
+	// Keys read from the page context
+	this.context = ['user', 'key', 'token', 'endpoint'];
+
 	/**
 	 * Initialize APIClient
 	 */
@@ -19,11 +22,14 @@ lense.import('api.client', function() {
 
 	/**
 	 * Get Client Parameters
+	 *
+	 * Prefer values from the page context, falling back to cookies.
 	 */
 	this.getParameters = function() {
 		var _params = {};
+		var api     = getattr(lense.context, 'API', {});
 		$.each(self.cookies, function(i,k) {
-			_params[k] = Cookies.get(k);
+			_params[k] = ($.inArray(k, self.context) > -1 && defined(getattr(api, k, null))) ? api[k]: Cookies.get(k);
 		});
 		return _params;
 	}
@@ -19,7 +19,8 @@ lense.import('api.interface', function() {
 		lense.implement([
 			'api.client',
 			'api.request',
-			'api.response'
+			'api.response',
+			'api.cache'
 		]);
 
 		// Open the API connection
@@ -124,6 +125,11 @@ lense.import('api.interface', function() {
 				lense.api.client.io.on('apiResponse', function(response) {
 					new lense.api.response.Object(response);
 				});
+
+				// Object changes pushed by the server
+				lense.api.client.io.on('objectUpdate', function(d) {
+					lense.api.cache.invalidate(d.type);
+				});
 			})
 		});
 	}
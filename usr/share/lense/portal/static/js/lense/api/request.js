@@ -5,41 +5,200 @@
  * Socket.IO proxy server.
  */
 lense.import('api.request', function() {
+	var self = this;
 
-	// Submitted requests
+	// In-flight requests by ID / by read request key
 	var requests = {};
+	var inflight = {};
+
+	// Timed out requests by ID, still run their callbacks on a late response
+	var expired  = {};
+
+	// Requests queued for the next frame
+	var queue    = [];
+
+	// Request ID counter
+	var counter  = 0;
+
+	// Default request timeout in milliseconds
+	this.timeout = 30000;
+
+	/**
+	 * Run Callback
+	 *
+	 * @param {String} callback The callback name, optionally with a key argument
+	 * @param {Object} data The response data
+	 */
+	function runCallback(callback, data) {
+		if (callback.contains('+')) {
+			var attrs = callback.split('+');
+			lense.callback[attrs[0]](attrs[1], data);
+		} else {
+			lense.callback[callback](data);
+		}
+	}
+
+	/**
+	 * Flush Queue
+	 *
+	 * Emit all requests submitted in the current tick, as a single frame if
+	 * the API server supports batches.
+	 */
+	function flush() {
+		var batch = queue;
+		queue = [];
+
+		// Single batched frame
+		if (batch.length > 1 && getattr(lense.api.support, 'batch', false)) {
+			lense.api.client.emit('apiSubmit', { 'batch': batch });
+			return true;
+		}
+
+		// One frame per request
+		$.each(batch, function(i,request) {
+			lense.api.client.emit('apiSubmit', request);
+		});
+	}
 
 	/**
 	 * Wait for all submitted API requests to complete
 	 *
 	 * @param {callback} Object An optional callback method
+	 * @param {timeout} Integer Optional timeout in milliseconds
+	 * @returns {Promise} Resolved when every pending request has settled
 	 */
-	this.waitAll = function(callback) {
+	this.waitAll = function(callback, timeout) {
+		var waiting  = $.Deferred();
+		var pending  = $.map(requests, function(request) { return request.deferred.promise(); });
+		var settled  = 0;
 
-		// Wait for all values to be true
-		requests.values().every(function(val) {
-			return (val === true) ? true: false;
+		// Resolve once all requests settle
+		function done() {
+			if (waiting.state() === 'pending') {
+				waiting.resolve();
+				if (defined(callback)) {
+					callback();
+				}
+			}
+		}
+		$.each(pending, function(i,promise) {
+			promise.always(function() {
+				settled++;
+				if (settled === pending.length) {
+					done();
+				}
+			});
 		});
 
-		// Optional callback
-		if (defined(callback)) {
-			callback();
+		// Nothing pending
+		if (!pending.length) {
+			done();
+
+		// Give up waiting
+		} else if (defined(timeout)) {
+			setTimeout(function() {
+				if (waiting.state() === 'pending') {
+					waiting.reject('timeout');
+				}
+			}, timeout);
 		}
+		return waiting.promise();
+	}
+
+	/**
+	 * Complete Request
+	 *
+	 * Settle a tracked request with its API response. A response arriving
+	 * after the request timed out still runs its callbacks.
+	 *
+	 * @param {String} id The request ID
+	 * @param {Object} response The API response object
+	 */
+	this.complete = function(id, response) {
+		var request = getattr(requests, id, null);
+
+		// Late response to a timed out request
+		if (request === null) {
+			request = getattr(expired, id, null);
+			if (request === null) {
+				lense.log.warn('Dropped API response for unknown request: ' + id);
+				return false;
+			}
+			delete expired[id];
+			lense.log.warn('Late API response for timed out request: ' + id);
+		}
+		delete requests[id];
+		if (inflight[request.key] === request) {
+			delete inflight[request.key];
+		}
+		clearTimeout(request.timer);
+
+		// Request failed
+		if (response.code !== 200) {
+			lense.log.api(response);
+			return request.deferred.reject(response);
+		}
+
+		// No callback, notify
+		if (!request.callbacks.length) {
+			lense.log.api(response);
+		}
+		$.each(request.callbacks, function(i,callback) {
+			runCallback(callback, response.data);
+		});
+		request.deferred.resolve(response.data);
 	}
 
 	/**
 	 * Submit API Request
 	 *
+	 * Identical read requests already in flight share a single request.
+	 *
 	 * @param {handler} The handler ID to submit the request to
 	 * @param {data}    Any additional request data
+	 * @param {callback} An optional callback name
+	 * @returns {Promise} Resolved with the response data
 	 */
 	this.submit = function(handler, data, callback) {
+		var key = handler + ':' + JSON.stringify(defined(data) ? data: null);
+
+		// Join an identical read request in flight
+		if (hasattr(inflight, key)) {
+			if (defined(callback)) {
+				inflight[key].callbacks.push(callback);
+			}
+			return inflight[key].deferred.promise();
+		}
+
+		// Expire any cached collection the request modifies
+		lense.api.cache.expire(handler);
+
+		// Tracked request
+		var id      = String(++counter);
+		var tracked = {
+			'key':       key,
+			'callbacks': (defined(callback) ? [callback]: []),
+			'deferred':  $.Deferred(),
+			'timer':     setTimeout(function() {
+				if (hasattr(requests, id)) {
+					delete requests[id];
+					delete inflight[key];
+					expired[id] = tracked;
+					lense.log.danger('API request timed out: ' + handler);
+					tracked.deferred.reject('timeout');
+				}
+			}, self.timeout)
+		};
+		requests[id] = tracked;
+		if (/_get$/.test(handler)) {
+			inflight[key] = tracked;
+		}
 
 		// Request object
 		var request = {
 			'auth':     lense.api.client.authentication(),
 			'handler':  handler,
-			'callback': callback
+			'callback': 'apiRequest+' + id
 		};
 
 		// If request data is supplied
@@ -47,8 +206,11 @@ lense.import('api.request', function() {
 			request['data'] = data;
 		}
 
-		// Submit the request
-		requests[handler] = false;
-		lense.api.client.emit('apiSubmit', request);
+		// Queue the request for the next frame
+		if (!queue.length) {
+			setTimeout(flush, 0);
+		}
+		queue.push(request);
+		return tracked.deferred.promise();
 	}
 });
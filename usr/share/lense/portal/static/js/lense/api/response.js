@@ -22,8 +22,12 @@ lense.import('api.response', function() {
 		 */
 		(function() {
 
+			// Tracked request, settled by the request layer
+			if (defined(inner.callback) && inner.callback.indexOf('apiRequest+') === 0) {
+				lense.api.request.complete(inner.callback.split('+')[1], inner);
+
 			// Run the callback
-			if (defined(inner.callback)) {
+			} else if (defined(inner.callback)) {
 
 				// Request failed
 				if (inner.code !== 200) {
@@ -52,7 +56,9 @@ lense.import('api.response', function() {
 	 * API Update Callback
 	 */
 	lense.register.callback('update', function(d) {
-		console.log('update');
+		if (hasattr(d, 'type')) {
+			lense.api.cache.invalidate(d.type);
+		}
 	});
 
 	/**
@@ -61,6 +61,9 @@ var lense = (function() {
 	// Current view
 	core.view        = url.param_get('view');
 
+	// Page context rendered by the server
+	core.context     = {};
+
 	// URL management
 	core.url         = new function() {
 		var inner = this;
@@ -198,9 +201,116 @@ var lense = (function() {
 		 });
 
 		 // Notification log
-		 $('#notification-log').append('<div class="alert alert-' + type + '" role="alert">' + message + '</div>');
+		 core.history.push(type, message);
 	 }
 
+	/**
+	 * Notification History
+	 *
+	 * Fixed capacity ring buffer of notifications with per type counters. The
+	 * notification log is only rendered from the buffer while it is open.
+	 */
+	core.history = new function() {
+		var inner = this;
+
+		// Buffered entries / oldest entry / entry count
+		var entries = [];
+		var head    = 0;
+		var length  = 0;
+
+		// Default capacity
+		inner.size     = 200;
+
+		// Buffer capacity / messages seen per type / messages dropped
+		inner.capacity = null;
+		inner.counts   = {};
+		inner.dropped  = 0;
+
+		/**
+		 * Resize Buffer
+		 *
+		 * Keep the newest entries that fit in a new capacity.
+		 *
+		 * @param {Integer} capacity The number of entries to keep
+		 */
+		inner.resize = function(capacity) {
+			var kept = inner.entries().slice(-capacity);
+			inner.dropped  += (length - kept.length);
+			inner.capacity = capacity;
+			entries = kept;
+			head    = 0;
+			length  = kept.length;
+		}
+
+		/**
+		 * Push Entry
+		 *
+		 * @param {String} type The notification type
+		 * @param {String} message The notification message
+		 */
+		inner.push = function(type, message) {
+			if (inner.capacity === null) {
+				inner.resize(parseInt(core.preferences.get('notification_history', inner.size)) || inner.size);
+			}
+			inner.counts[type] = getattr(inner.counts, type, 0) + 1;
+
+			// Overwrite the oldest entry when full
+			var entry = { 'type': type, 'message': message, 'time': Date.now() };
+			if (length < inner.capacity) {
+				entries[(head + length) % inner.capacity] = entry;
+				length++;
+			} else {
+				entries[head] = entry;
+				head = (head + 1) % inner.capacity;
+				inner.dropped++;
+			}
+
+			// Keep the log current while it is open
+			if ($('#notifications').hasClass('in')) {
+				inner.render();
+			}
+		}
+
+		/**
+		 * Buffered Entries
+		 *
+		 * @returns {Array} Entries from oldest to newest
+		 */
+		inner.entries = function() {
+			var ordered = [];
+			for (var i = 0; i < length; i++) {
+				ordered.push(entries[(head + i) % inner.capacity]);
+			}
+			return ordered;
+		}
+
+		/**
+		 * Clear Buffer
+		 */
+		inner.clear = function() {
+			entries = [];
+			head    = 0;
+			length  = 0;
+			inner.counts  = {};
+			inner.dropped = 0;
+		}
+
+		/**
+		 * Render Notification Log
+		 */
+		inner.render = function() {
+			var html = $.map(inner.entries(), function(entry) {
+				return '<div class="alert alert-' + entry.type + '" role="alert">' + entry.message + '</div>';
+			});
+
+			// Older entries no longer buffered
+			if (inner.dropped) {
+				html.unshift('<p class="text-muted">' + inner.dropped + ' older notification(s) not shown</p>');
+			}
+			$('#notification-log').html(html.join(''));
+		}
+	}
+
 	/**
 	 * Local Preferences
 	 */
@@ -329,6 +439,17 @@ var lense = (function() {
 	 * @param {c} Interface modules
 	 */
 	core.bootstrap = function(c) {
+		var context = document.getElementById('lense-context');
+
+		// Read the page context once
+		if (context !== null && context.textContent.trim()) {
+			core.context = JSON.parse(context.textContent);
+		}
+
+		// Render the notification log when opened
+		$('#notifications').on('show.bs.modal', function() {
+			core.history.render();
+		});
 
 		// Extended data elements
 		$.each(['x-var'], function(i,e) {
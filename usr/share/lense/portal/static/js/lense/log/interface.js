@@ -61,8 +61,8 @@ lense.import('log.interface', function() {
 			});
 		}
 
-		// Store in notifications container
-		$('#notification-log').append('<div class="alert alert-' + type + '" role="alert">' + message + '</div>');
+		// Store in notification history
+		lense.history.push(type, message);
   }
 
 	/**
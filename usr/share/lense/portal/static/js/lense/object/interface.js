@@ -29,7 +29,10 @@ lense.import('object.interface', function() {
 
 		// Delete object modal
 		$(document).on('show.bs.modal', '#object-delete', function() {
-			var target = $('input[uuid]:visible:checked').val();
+			var current = self.current();
+
+			// List selections include rows scrolled out of the rendered window
+			var target  = ((defined(current) && current.view == 'list') ? current.list.selection()[0]: $('input[uuid]:visible:checked').val());
 			if (!defined(target)) {
 				lense.log.warn('Must select an object to delete!');
 				return false;
@@ -642,6 +645,309 @@ lense.import('object.interface', function() {
 		return local;
 	}
 
+	/**
+	 * List interface. Holds the collection for the list view, sorted,
+	 * filtered and paged by the API server if supported or locally otherwise,
+	 * and only renders the rows in view.
+	 *
+	 * @param {Object} parent The parent object interface
+	 */
+	function ListInterface(parent) {
+		var local = new BaseInterface('list', this);
+
+		// Page size / rows rendered outside the view / thumbnails per chunk
+		local.size      = 500;
+		local.overscan  = 10;
+		local.chunk     = 48;
+
+		// Full local collection / current page / total matching objects
+		local.all       = null;
+		local.objects   = [];
+		local.total     = 0;
+
+		// Paging / sorting / filtering state
+		local.offset    = 0;
+		local.sort      = null;
+		local.order     = 'asc';
+		local.filter    = '';
+
+		// Selected object UUIDs
+		local.selected  = {};
+
+		// Row height in pixels / rendered row window / rendered thumbnails
+		local.rowHeight = 37;
+		local.window    = null;
+		local.rendered  = 0;
+
+		/**
+		 * Check if the API server pages collections
+		 */
+		local.remote = function() {
+			return getattr(lense.api.support, 'paging', false);
+		}
+
+		/**
+		 * Page request parameters, if the API server pages collections
+		 */
+		local.params = function() {
+			if (!local.remote()) {
+				return null;
+			}
+			return {
+				page: {
+					offset: local.offset,
+					limit: local.size,
+					sort: local.sort,
+					order: local.order,
+					filter: local.filter
+				}
+			};
+		}
+
+		/**
+		 * Load a collection or a page of a collection
+		 *
+		 * @param {Object} data The collection array or paged response
+		 */
+		local.load = function(data) {
+
+			// Paged by the API server
+			if (data !== null && istype(data, 'object') && hasattr(data, 'objects')) {
+				local.all     = null;
+				local.objects = data.objects;
+				local.total   = getattr(data, 'total', data.objects.length);
+
+			// Full collection
+			} else {
+				local.all = ($.isArray(data) ? data: []);
+				local.apply();
+			}
+			local.window   = null;
+			local.rendered = 0;
+		}
+
+		/**
+		 * Loaded collection, the full collection if held locally or the
+		 * current page otherwise
+		 */
+		local.collection = function() {
+			return ((local.all !== null) ? local.all: local.objects);
+		}
+
+		/**
+		 * Selected object UUIDs on the current page, in list order
+		 */
+		local.selection = function() {
+			return $.map(local.objects, function(object) {
+				return (hasattr(local.selected, object.uuid) ? object.uuid: null);
+			});
+		}
+
+		/**
+		 * Sort, filter and page the local collection
+		 */
+		local.apply = function() {
+			var objects = local.all;
+
+			// Filter on listed fields
+			if (local.filter) {
+				var needle = local.filter.toLowerCase();
+				var keys   = [];
+				parent.template.each(function(key, attrs) {
+					if (attrs.list) {
+						keys.push(key);
+					}
+				});
+				objects = $.grep(objects, function(object) {
+					for (var i = 0; i < keys.length; i++) {
+						var value = object[keys[i]];
+						if (value !== null && value !== undefined && String(value).toLowerCase().indexOf(needle) !== -1) {
+							return true;
+						}
+					}
+					return false;
+				});
+			}
+
+			// Sort on a single field
+			if (local.sort) {
+				var key       = local.sort;
+				var direction = ((local.order === 'desc') ? -1: 1);
+				objects = objects.slice(0).sort(function(a,b) {
+					var x = a[key], y = b[key];
+					if (x === y) {
+						return 0;
+					}
+					if (x === null || x === undefined) {
+						return 1;
+					}
+					if (y === null || y === undefined) {
+						return -1;
+					}
+					return ((x > y) ? 1: -1) * direction;
+				});
+			}
+
+			// Current page
+			local.total   = objects.length;
+			local.offset  = Math.min(local.offset, Math.max(0, local.total - 1));
+			local.offset -= local.offset % local.size;
+			local.objects = objects.slice(local.offset, local.offset + local.size);
+		}
+
+		/**
+		 * Refresh the current page
+		 */
+		local.refresh = function() {
+			if (local.remote()) {
+				lense.api.request.submit(getattr(parent.opts.handler, 'get'), local.params(), 'objectListResponse');
+			} else if (local.all !== null) {
+				local.apply();
+				local.window   = null;
+				local.rendered = 0;
+				local.render();
+			}
+		}
+
+		/**
+		 * Render a single row
+		 */
+		local.row = function(object) {
+			var html = Handlebars.helpers.object_row(object, parent.template);
+			return (hasattr(local.selected, object.uuid) ? html.replace('<input type="checkbox"', '<input type="checkbox" checked'): html);
+		}
+
+		/**
+		 * Render the rows in view, with spacers standing in for the rest
+		 */
+		local.renderRows = function() {
+			var container = $('#object-list-rows');
+			var count     = local.objects.length;
+			var top       = container.scrollTop();
+			var height    = container.height() || 600;
+			var start     = Math.max(0, Math.floor(top / local.rowHeight) - local.overscan);
+			var end       = Math.min(count, Math.ceil((top + height) / local.rowHeight) + local.overscan);
+
+			// Window unchanged
+			if (local.window !== null && local.window[0] === start && local.window[1] === end) {
+				return false;
+			}
+			local.window = [start, end];
+
+			// Spacers / visible rows
+			var html = [];
+			if (start > 0) {
+				html.push('<tr class="object-spacer" style="height:' + (start * local.rowHeight) + 'px;"></tr>');
+			}
+			for (var i = start; i < end; i++) {
+				html.push(local.row(local.objects[i]));
+			}
+			if (end < count) {
+				html.push('<tr class="object-spacer" style="height:' + ((count - end) * local.rowHeight) + 'px;"></tr>');
+			}
+			$('#object-rows-body').html(html.join(''));
+
+			// Measure the real row height once
+			var measured = $('#object-rows-body tr[uuid]').first().outerHeight();
+			if (measured && measured !== local.rowHeight) {
+				local.rowHeight = measured;
+				local.window    = null;
+				local.renderRows();
+			}
+		}
+
+		/**
+		 * Append the next chunk of thumbnails
+		 */
+		local.renderThumbnails = function() {
+			var end = Math.min(local.objects.length, local.rendered + local.chunk);
+			var html = [];
+			for (var i = local.rendered; i < end; i++) {
+				html.push(Handlebars.helpers.object_thumbnail(local.objects[i], parent.template));
+			}
+			$('#object-list-thumbnails')[((local.rendered === 0) ? 'html': 'append')](html.join(''));
+			local.rendered = end;
+		}
+
+		/**
+		 * Render the list view
+		 */
+		local.render = function() {
+			$('#object-rows-headers').html(Handlebars.helpers.object_headers(parent.template).string);
+			$('#object-list-rows').scrollTop(0);
+			$('#object-list-thumbnails').scrollTop(0);
+			local.renderRows();
+			local.renderThumbnails();
+
+			// Pager
+			$('#object-footer').html(Handlebars.helpers.page_objects(local.offset, local.objects.length, local.total).string);
+		}
+
+		/**
+		 * Bind list events
+		 */
+		local.bind = function() {
+			var pending = false, timer = null;
+
+			// Re-render the row window on scroll, once per frame
+			$('#object-list-rows').on('scroll', function() {
+				if (!pending) {
+					pending = true;
+					window.requestAnimationFrame(function() {
+						pending = false;
+						local.renderRows();
+					});
+				}
+			});
+
+			// Append thumbnails near the bottom
+			$('#object-list-thumbnails').on('scroll', function() {
+				var elem = $(this);
+				if (local.rendered < local.objects.length && elem.scrollTop() + elem.innerHeight() >= this.scrollHeight - 200) {
+					local.renderThumbnails();
+				}
+			});
+
+			// Track selections across re-rendering
+			$(document).on('change', 'input[type="checkbox"][uuid]', function() {
+				if ($(this).is(':checked')) {
+					local.selected[$(this).val()] = true;
+				} else {
+					delete local.selected[$(this).val()];
+				}
+			});
+
+			// Sort, toggling the order when sorting on the same field
+			$(document).on('change', 'select[object-sort]', function() {
+				var key = $(this).val();
+				local.order  = ((key === local.sort && local.order === 'asc') ? 'desc': 'asc');
+				local.sort   = ((defined(key) && key !== 'null') ? key: null);
+				local.offset = 0;
+				local.refresh();
+			});
+
+			// Filter
+			$(document).on('input', 'input[object-filter]', function() {
+				var value = $(this).val();
+				clearTimeout(timer);
+				timer = setTimeout(function() {
+					local.filter = value;
+					local.offset = 0;
+					local.refresh();
+				}, 250);
+			});
+
+			// Page
+			$(document).on('click', 'button[object-page]', function() {
+				local.offset = Math.max(0, local.offset + ((getattr($(this), 'object-page') === 'next') ? local.size: -local.size));
+				local.refresh();
+			});
+		}
+
+		// Return the list interface
+		return local;
+	}
+
 	/**
 	 * Object Interface
 	 *
@@ -657,8 +963,9 @@ lense.import('object.interface', function() {
 		local.properties = {};
 		local.groups     = {};
 
-		// Grid interface
+		// Grid interface / list interface
 		local.grid   = new GridInterface();
+		local.list   = new ListInterface(local);
 
 		// UUID and type
 		local.uuid   = uuid;
@@ -808,6 +1115,11 @@ lense.import('object.interface', function() {
 		 */
 		local.__init__ = function() {
 
+			// List view events
+			if (local.view == 'list') {
+				local.list.bind();
+			}
+
 			// Set view state
 			$.each(['list', 'object'], function(i,key) {
 				$('div[view="' + key + '"]').css('display', ((local.view == key) ? 'block':'none'));
@@ -1137,6 +1449,13 @@ lense.import('object.interface', function() {
 			return Handlebars.helpers.sort_objects(local.template).string
 		}
 
+		/**
+		 * Bootstrap filter controls
+		 */
+		local.bootstrapFilterControls = function() {
+			return Handlebars.helpers.filter_objects().string;
+		}
+
 		/**
 		 * Bootstrap the object header
 		 */
@@ -1166,37 +1485,6 @@ lense.import('object.interface', function() {
 			}
 		}
 
-		/**
-		 * Bootstrap the object thumbnails layout
-		 */
-		local.bootstrapThumbnails = function () {
-			var thumbnails = [];
-			$.each(local.data.object, function(i,object) {
-				thumbnails.push(Handlebars.helpers.object_thumbnail(object, local.template));
-			});
-			return thumbnails.join('');
-		}
-
-		/**
-		 * Bootstrap the object rows layout
-		 */
-		local.bootstrapRows = function() {
-			var headers = Handlebars.helpers.object_headers(local.template);
-			var rows    = [];
-
-			// Process data
-			local.data.each(function(i,object) {
-				rows.push(Handlebars.helpers.object_row(object, local.template));
-			});
-
-			// Render headers
-			$('#object-rows-headers').html(headers.string);
-
-			// Render rows
-			$('#object-rows-body').html(rows.join(''));
-			return '';
-		}
-
 		/**
 		 * Render worker
 		 *
@@ -1241,6 +1529,7 @@ lense.import('object.interface', function() {
 				case "footer":
 				case "controls-create":
 				case "sort":
+				case "filter":
 				 return worker
 				 break;
 				default:
@@ -1260,13 +1549,13 @@ lense.import('object.interface', function() {
 			switch(local.view) {
 				case "list":
 
-					// List controls / sorting manager
-					local.render('list-controls')(local.bootstrapListControls());
-					local.render('sort')(local.bootstrapSortControls());
+					// List controls / sorting / filtering manager
+					local.render('list-controls')(local.bootstrapListControls(), true);
+					local.render('sort')(local.bootstrapSortControls(), true);
+					local.render('filter')(local.bootstrapFilterControls(), true);
 
 					// Construct the object list / thumbnail layouts
-					local.render('list-rows')(local.bootstrapRows());
-					local.render('list-thumbnails')(local.bootstrapThumbnails());
+					local.list.render();
 
 					break;
 				case "object":
@@ -1321,6 +1610,15 @@ lense.import('object.interface', function() {
 			}
 		});
 
+		/**
+		 * Callback for a refreshed list page
+		 */
+		lense.register.callback('objectListResponse', function(data) {
+			local.list.load(data);
+			local.data = new DataInterface(local.list.collection());
+			local.list.render();
+		});
+
 		/**
 		 * Callback for supplementary data
 		 */
@@ -1334,8 +1632,11 @@ lense.import('object.interface', function() {
 			*/
     lense.register.callback('objectResponse', function(data) {
 
-			// Setup the data interface
-			local.data = new DataInterface(data);
+			// Setup the data interface, the list interface pages collections
+			if (local.view == 'list') {
+				local.list.load(data);
+			}
+			local.data = new DataInterface(((local.view == 'list') ? local.list.collection(): data));
 
 			// Get permissions if viewing a single object
 			if (defined(local.uuid)) {
@@ -1362,7 +1663,7 @@ lense.import('object.interface', function() {
  				return lense.callback['objectResponse'](local.template.object);
  			}
 
- 			// Retrieve the primary object
+ 			// Retrieve the primary object, always as full records
 			self.waitFor('object', function() {
 				lense.api.request.submit(getattr(local.opts.handler, 'get'), (function() {
 					if (defined(local.uuid)) {
@@ -1370,18 +1671,18 @@ lense.import('object.interface', function() {
 			 				uuid: local.uuid,
 			 			};
 					}
-					return null;
+					return local.list.params();
 				}()), 'objectResponse');
 			});
 
 			// Wait to fetch the primary object
 			self.wait(function() {
 
-				// If retrieving secondary data
+				// If retrieving secondary data, lookups may be answered from snapshots
 				if (data) {
 					$.each(data, function(k,h) {
 						self.waitFor(k, function() {
-							lense.api.request.submit(h, null, 'dataResponse+' + k);
+							lense.api.cache.submit(h, null, 'dataResponse+' + k);
 						});
 					});
 
@@ -908,6 +908,36 @@ lense.import('object.library', function() {
 			);
 		});
 
+		/**
+		 * Filter input
+		 */
+		Handlebars.registerHelper('filter_objects', function(opts) {
+			return new Handlebars.SafeString(
+				'<span class="input-group-addon thumbnail-field-label thumbnail-field-label-inline">Filter: </span>' +
+				'<input type="text" class="form-control property-field-value property-field-inline" object-filter>'
+			);
+		});
+
+		/**
+		 * List pager
+		 *
+		 * @param {Integer} offset The first object offset
+		 * @param {Integer} count The number of objects on the page
+		 * @param {Integer} total The total number of objects
+		 */
+		Handlebars.registerHelper('page_objects', function(offset, count, total, opts) {
+			var first = ((total > 0) ? offset + 1: 0);
+			return new Handlebars.SafeString(
+				'<span class="object-pager-info">' + first + ' - ' + (offset + count) + ' of ' + total + '</span>' +
+				'<div class="btn-group pull-right" role="group">' +
+				'<button type="button" class="btn btn-default btn-sm" object-page="prev"' + ((offset > 0) ? '': ' disabled') + '>' +
+				'<span class="glyphicon glyphicon-chevron-left"></span></button>' +
+				'<button type="button" class="btn btn-default btn-sm" object-page="next"' + ((offset + count < total) ? '': ' disabled') + '>' +
+				'<span class="glyphicon glyphicon-chevron-right"></span></button>' +
+				'</div>'
+			);
+		});
+
 		/**
 		 * Sort options
 		 *
@@ -61,6 +61,20 @@ lense.import('template.interface', function() {
 		});
 	}
 
+	/**
+	 * Get a compiled Handlebars template. Templates are served precompiled on
+	 * Handlebars.templates, inline templates are compiled once on first use.
+	 *
+	 * @param {String} id The template ID
+	 */
+	this.template = function(id) {
+		Handlebars.templates = Handlebars.templates || {};
+		if (!hasattr(Handlebars.templates, id)) {
+			Handlebars.templates[id] = Handlebars.compile($('#' + id).html());
+		}
+		return Handlebars.templates[id];
+	}
+
 	/**
 	 * Compile a Handlebars template.
    *
@@ -70,7 +84,7 @@ lense.import('template.interface', function() {
 	 */
 	this.compile = function(id, data, opts) {
 		var compiler = {};
-		compiler.compiled = Handlebars.compile($('#' + id).html())(data);
+		compiler.compiled = self.template(id)(data);
 
 		/**
 		 * Return compiled HTML
@@ -83,18 +97,35 @@ lense.import('template.interface', function() {
 		return compiler
 	}
 
+	// Request methods available to templates
+	var METHODS = ["GET", "POST", "PUT", "DELETE"];
+
+	/**
+	 * Template Constants
+	 *
+	 * Values shared by every item in a render, computed once per render.
+	 */
+	this._constants = function() {
+		return {
+			path: window.location.pathname,
+			view: lense.url.getParam('view'),
+			uuid: lense.url.getParam('uuid')
+		};
+	}
+
 	/**
 	 * Set Template Internals
 	 */
-	this._set_data = function(data, display, title) {
+	this._set_data = function(data, display, title, constants) {
+		var constants          = ((defined(constants)) ? constants: self._constants());
 		var _data_             = {};
 		_data_['_DATA_']       = data;
 		_data_['_DISPLAY_']    = extract(data, display);
 		_data_['_TITLE_']      = getattr(data, title, title);
-		_data_['_PATH_']       = window.location.pathname;
-		_data_['_METHODS_']    = ["GET", "POST", "PUT", "DELETE"];
-		_data_['_VIEW_']       = lense.url.getParam('view');
-		_data_['_UUID_']       = lense.url.getParam('uuid');
+		_data_['_PATH_']       = constants.path;
+		_data_['_METHODS_']    = METHODS;
+		_data_['_VIEW_']       = constants.view;
+		_data_['_UUID_']       = constants.uuid;
 		_data_['_widgetUUID_'] = lense.uuid4();
 		return _data_;
 	}
@@ -110,25 +141,16 @@ lense.import('template.interface', function() {
 	 * @param {String} title The title string
 	 */
 	this._render = function(parent, id, data, flush, display, title) {
+		var compiled  = self.template(id);
+		var constants = self._constants();
 
-		// Compile the template
-		var compiled = Handlebars.compile($('#' + id).html());
-
-		// If flushing the container
-		if (flush === true) {
-			$(parent).empty();
-		}
-
-		// List of elements
-		if ($.isArray(data)) {
-			$.each(data, function(i,item) {
-				$(parent).append(compiled(self._set_data(item, display, title)));
-			});
+		// Render all items into a single insertion
+		var html = $.map(($.isArray(data) ? data: [data]), function(item) {
+			return compiled(self._set_data(item, display, title, constants));
+		}).join('');
 
-		// Single element
-		} else {
-			$(parent).append(compiled(self._set_data(data, display, title)));
-		}
+		// Replace or extend the container contents
+		$(parent)[((flush === true) ? 'html': 'append')](html);
 	}
 
 	/**
@@ -141,13 +163,10 @@ lense.import('template.interface', function() {
 	this._headers = function(parent, columns, title) {
 
 		// Compile the template
-		var compiled = Handlebars.compile($('#object_row_headers').html());
-
-		// Flush the header container
-		$(parent).empty();
+		var compiled = self.template('object_row_headers');
 
 		// Render the headers
-		$(parent).append(compiled(self._set_data(columns, {}, title)));
+		$(parent).html(compiled(self._set_data(columns, {}, title)));
 	}
 
 	/**